@@ -1,24 +1,43 @@
 """Thin wrapper around Fatture in Cloud SDK."""
 
-import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property, lru_cache
+from itertools import count
+from typing import Callable, Iterable, Iterator
 
-from dotenv import load_dotenv
 import fattureincloud_python_sdk
 from fattureincloud_python_sdk.api import ReceivedDocumentsApi, InfoApi
+from fattureincloud_python_sdk.exceptions import ApiException
 from fattureincloud_python_sdk.models import (
     CreateReceivedDocumentRequest,
     ModifyReceivedDocumentRequest,
     ReceivedDocument,
     ReceivedDocumentType,
     Entity,
+    ListReceivedDocumentsResponse,
     ReceivedDocumentPaymentsListItem,
     PaymentAccount,
 )
 
+from .config import get_settings
+from .utils import add_months, split_amount
 
-@dataclass
+
+# Lowercase names of the rate limit headers read by QuotaInfo.from_headers()
+_QUOTA_KEYS = frozenset({
+    "ratelimit-hourlyremaining",
+    "ratelimit-hourlylimit",
+    "ratelimit-monthlyremaining",
+    "ratelimit-monthlylimit",
+})
+
+
+@dataclass(slots=True, frozen=True)
 class QuotaInfo:
     """API quota information from response headers."""
 
@@ -32,19 +51,29 @@ class QuotaInfo:
         """Create QuotaInfo from HTTP response headers.
 
         FIC API uses PascalCase headers like 'RateLimit-HourlyRemaining'.
-        We normalize to lowercase for case-insensitive lookup.
+        We match them case-insensitively in a single pass, keeping only the
+        rate limit headers instead of lowercasing the whole response.
         """
-        # Normalize headers to lowercase for case-insensitive lookup
-        lower_headers = {k.lower(): v for k, v in headers.items()}
+        lower_headers = {}
+        for key, value in headers.items():
+            key = key.lower()
+            if key in _QUOTA_KEYS:
+                lower_headers[key] = value
+
+        # Header values are strings; defaults are already ints and skip the cast
+        hourly_limit = lower_headers.get("ratelimit-hourlylimit")
+        hourly_limit = int(hourly_limit) if hourly_limit is not None else 1000
+        monthly_limit = lower_headers.get("ratelimit-monthlylimit")
+        monthly_limit = int(monthly_limit) if monthly_limit is not None else 40000
 
         # Use remaining values, defaulting to limit (not 0) if not found
-        hourly_limit = int(lower_headers.get("ratelimit-hourlylimit", 1000))
-        monthly_limit = int(lower_headers.get("ratelimit-monthlylimit", 40000))
+        hourly_remaining = lower_headers.get("ratelimit-hourlyremaining")
+        monthly_remaining = lower_headers.get("ratelimit-monthlyremaining")
 
         return cls(
-            hourly_remaining=int(lower_headers.get("ratelimit-hourlyremaining", hourly_limit)),
+            hourly_remaining=int(hourly_remaining) if hourly_remaining is not None else hourly_limit,
             hourly_limit=hourly_limit,
-            monthly_remaining=int(lower_headers.get("ratelimit-monthlyremaining", monthly_limit)),
+            monthly_remaining=int(monthly_remaining) if monthly_remaining is not None else monthly_limit,
             monthly_limit=monthly_limit,
         )
 
@@ -69,50 +98,228 @@ class QuotaInfo:
         return self.monthly_used / self.monthly_limit if self.monthly_limit else 0
 
 
+class TokenBucket:
+    """Thread-safe token bucket used to throttle API calls client-side.
+
+    Tokens refill continuously at `capacity / per_seconds` per second.
+    The bucket is also kept in sync with the remaining quota reported by
+    the API, so requests made elsewhere (other clients, other sessions)
+    are accounted for.
+    """
+
+    def __init__(self, capacity: int, per_seconds: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+        self.tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill (lock must be held)."""
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self._last) * self.rate, self.capacity)
+        self._last = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available."""
+        with self._lock:
+            self._refill()
+            # Reserve the token now (tokens may go negative) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            self.tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+
+    def sync(self, remaining: int, capacity: int) -> None:
+        """Align the bucket with the quota reported by the API."""
+        with self._lock:
+            self._refill()
+            if capacity and capacity != self.capacity:
+                self.rate = self.rate * capacity / self.capacity
+                self.capacity = capacity
+            self.tokens = min(self.tokens, remaining)
+
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited (429) request.
+
+    Honors the Retry-After header when present, otherwise backs off
+    exponentially (1s, 2s, 4s, ...).
+    """
+    retry_after = headers.get("Retry-After") if headers else None
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return float(2 ** attempt)
+
+
 class FICClient:
     """Client for Fatture in Cloud API."""
 
     # Class-level quota tracking (shared across instances)
     last_quota: QuotaInfo | None = None
 
+    # Client-side throttling (shared across instances), sized on the hourly limit
+    _bucket = TokenBucket(capacity=1000, per_seconds=3600)
+
+    # Retries on HTTP 429 before giving up
+    MAX_RETRIES = 3
+
+    # Seconds a cached expense may be reused as the base of an update
+    EXPENSE_CACHE_TTL = 30.0
+
+    # Payment accounts rarely change: company id -> (time, accounts)
+    _payment_accounts_cache: dict[int, tuple[float, list[PaymentAccount]]] = {}
+
+    # Seconds the payment accounts list is reused
+    PAYMENT_ACCOUNTS_TTL = 300.0
+
     def __init__(self):
         """Initialize client from environment variables."""
-        load_dotenv()
-
-        self.access_token = os.getenv("FIC_ACCESS_TOKEN")
-        self.company_id = os.getenv("FIC_COMPANY_ID")
+        settings = get_settings()
+        access_token = settings.access_token
+        company_id = settings.company_id
 
-        if not self.access_token or not self.company_id:
+        if not access_token or not company_id:
             raise ValueError(
                 "Missing credentials! "
                 "Set FIC_ACCESS_TOKEN and FIC_COMPANY_ID in .env file"
             )
 
-        self.company_id = int(self.company_id)
+        try:
+            company_id = int(company_id)
+        except ValueError:
+            raise ValueError(f"FIC_COMPANY_ID must be a number, got {company_id!r}") from None
+
+        self.access_token = access_token
+        self.company_id = company_id
 
         # Configure SDK
         self.config = fattureincloud_python_sdk.Configuration()
         self.config.access_token = self.access_token
+        # Keep enough pooled keep-alive connections for concurrent page fetches
+        self.config.connection_pool_maxsize = self.POOL_MAXSIZE
 
-    def _get_api(self) -> ReceivedDocumentsApi:
-        """Get ReceivedDocuments API client instance."""
-        api_client = fattureincloud_python_sdk.ApiClient(self.config)
-        return ReceivedDocumentsApi(api_client)
+        # Recently fetched/updated expenses of this company: id -> (time, expense)
+        self._expense_cache: dict[int, tuple[float, ReceivedDocument]] = {}
+        self._expense_cache_lock = threading.Lock()
+
+    def __enter__(self) -> "FICClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-    def _get_info_api(self) -> InfoApi:
-        """Get Info API client instance."""
+    @cached_property
+    def _api_client(self) -> fattureincloud_python_sdk.ApiClient:
+        """Shared SDK client, so every call reuses the same connection pool."""
         api_client = fattureincloud_python_sdk.ApiClient(self.config)
-        return InfoApi(api_client)
+        # List pages are large JSON documents; urllib3 decompresses transparently
+        api_client.set_default_header("Accept-Encoding", "gzip")
+        return api_client
+
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker threads for concurrent requests, kept for the client's lifetime.
+
+        Reusing one pool avoids starting MAX_WORKERS threads for every paged
+        listing, bulk payment or recurring series. Tasks submitted here must
+        not wait on other tasks of the same pool.
+        """
+        return ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="fic-io")
+
+    @cached_property
+    def _api(self) -> ReceivedDocumentsApi:
+        """ReceivedDocuments API bound to the shared client."""
+        return ReceivedDocumentsApi(self._api_client)
+
+    @cached_property
+    def _info_api(self) -> InfoApi:
+        """Info API bound to the shared client."""
+        return InfoApi(self._api_client)
+
+    def close(self) -> None:
+        """Stop the worker threads and release pooled HTTP connections.
+
+        Requests already queued on the executor still run (a reset must not
+        fail a page fetch or payment in progress); the connections are
+        released once they have finished, without blocking the caller.
+        """
+        with self._expense_cache_lock:
+            self._expense_cache.clear()
+        executor = self.__dict__.pop("executor", None)
+        if executor is None:
+            self._release_connections()
+            return
+        executor.shutdown(wait=False)
+        threading.Thread(
+            target=self._release_after, args=(executor,), name="fic-close", daemon=True
+        ).start()
+
+    def _release_after(self, executor: ThreadPoolExecutor) -> None:
+        """Wait for the executor's pending work, then release the connections."""
+        executor.shutdown(wait=True)
+        self._release_connections()
+
+    def _release_connections(self) -> None:
+        """Drop the SDK client and close its pooled connections."""
+        api_client = self.__dict__.pop("_api_client", None)
+        if api_client is not None:
+            api_client.rest_client.pool_manager.clear()
+        self.__dict__.pop("_api", None)
+        self.__dict__.pop("_info_api", None)
+
+    def _cache_expense(self, document_id: int, expense: ReceivedDocument) -> None:
+        """Remember a just fetched/updated expense, dropping expired entries."""
+        now = time.monotonic()
+        with self._expense_cache_lock:
+            cache = self._expense_cache
+            for stale_id in [
+                doc_id
+                for doc_id, (fetched_at, _) in cache.items()
+                if now - fetched_at >= self.EXPENSE_CACHE_TTL
+            ]:
+                del cache[stale_id]
+            cache[document_id] = (now, expense)
 
     def _update_quota(self, headers: dict) -> None:
         """Update quota info from response headers."""
         if headers:
-            FICClient.last_quota = QuotaInfo.from_headers(headers)
+            quota = QuotaInfo.from_headers(headers)
+            FICClient.last_quota = quota
+            FICClient._bucket.sync(quota.hourly_remaining, quota.hourly_limit)
+
+    def _call(self, method, **kwargs):
+        """Call an SDK `*_with_http_info` method with throttling.
+
+        Waits for a rate-limit token before each attempt, retries on HTTP 429
+        and records the quota from the response headers.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            FICClient._bucket.acquire()
+            try:
+                response = method(**kwargs)
+            except ApiException as e:
+                if e.status != 429 or attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(_retry_delay(e.headers, attempt))
+                continue
+            self._update_quota(response.headers)
+            return response
 
     # API per_page constraints (enforced by SDK/API)
     MIN_PER_PAGE = 5
     MAX_PER_PAGE = 100
 
+    # Concurrent page requests when fetching multiple pages
+    MAX_WORKERS = 8
+
+    # Pooled HTTPS connections kept alive (SDK default is cpu_count * 5)
+    POOL_MAXSIZE = 16
+
     def list_expenses(
         self,
         *,
@@ -133,8 +340,6 @@ class FICClient:
         Returns:
             List of expense documents
         """
-        api = self._get_api()
-
         # fetch_all=True is equivalent to limit=None
         if fetch_all:
             limit = None
@@ -145,64 +350,190 @@ class FICClient:
         # Single page fetch optimization: if limit <= MAX_PER_PAGE, just fetch one page
         if limit is not None and limit <= self.MAX_PER_PAGE:
             per_page = max(self.MIN_PER_PAGE, limit)
-            response = api.list_received_documents_with_http_info(
-                company_id=self.company_id,
-                type="expense",
-                q=q,
-                sort=sort,
-                page=1,
-                per_page=per_page,
-            )
-            self._update_quota(response.headers)
-            return response.data.data or []
+            return self._list_page(1, per_page, q=q, sort=sort).data or []
 
         # Multi-page fetch: either fetch_all or limit > MAX_PER_PAGE
-        all_expenses = []
-        page = 1
-        while True:
-            response = api.list_received_documents_with_http_info(
-                company_id=self.company_id,
-                type="expense",
-                q=q,
-                sort=sort,
-                page=page,
-                per_page=per_page,
-            )
-            self._update_quota(response.headers)
-            expenses = response.data.data or []
-            if not expenses:
-                break
-            all_expenses.extend(expenses)
+        pages = self.iter_expense_pages(q=q, sort=sort, limit=limit)
+        return [expense for page in pages for expense in page]
 
-            # If we have a limit, stop when we've collected enough
-            if limit is not None and len(all_expenses) >= limit:
-                return all_expenses[:limit]
+    def iter_expenses(
+        self,
+        *,
+        q: str | None = None,
+        sort: str | None = None,
+        max_pages: int | None = None,
+    ) -> Iterator[ReceivedDocument]:
+        """
+        Iterate over expenses, yielding each one as soon as its page is available.
 
-            page += 1
+        Args:
+            q: Filter query (e.g., "entity.name = 'Amazon'")
+            sort: Sort field (e.g., "-date" for descending)
+            max_pages: Stop after this many pages. None fetches all pages.
 
-        return all_expenses
+        Yields:
+            Expense documents
+        """
+        limit = None if max_pages is None else max_pages * self.MAX_PER_PAGE
+        for page in self.iter_expense_pages(q=q, sort=sort, limit=limit):
+            yield from page
+
+    def iter_expense_pages(
+        self,
+        *,
+        q: str | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        first_page_size: int | None = None,
+    ) -> Iterator[list[ReceivedDocument]]:
+        """
+        Iterate over pages of expenses, yielding each page as soon as it is available.
+
+        The first page tells us how many expenses there are; the remaining pages
+        are fetched concurrently (MAX_PER_PAGE each) and yielded in order.
+
+        Args:
+            q: Filter query (e.g., "entity.name = 'Amazon'")
+            sort: Sort field (e.g., "-date" for descending)
+            limit: Max number of expenses to yield. None yields all.
+            first_page_size: Size of the first page. A small first page gets
+                rows on screen sooner; its items are skipped from the next page.
+
+        Yields:
+            Non-empty lists of expense documents
+        """
+        per_page = self.MAX_PER_PAGE
+        first_size = per_page
+        if first_page_size is not None:
+            first_size = max(self.MIN_PER_PAGE, min(first_page_size, per_page))
+        remaining = limit
+
+        first = self._list_page(1, first_size, q=q, sort=sort)
+        data = first.data or []
+        if remaining is not None:
+            data = data[:remaining]
+            remaining -= len(data)
+        if not data:
+            return
+        yield data
+        if len(data) < first_size or remaining == 0:
+            return
+
+        # Items of the first page are also the head of page 1 at per_page
+        start_page, skip = (1, first_size) if first_size < per_page else (2, 0)
+
+        total = first.total
+        if total is None and first_size == per_page and first.last_page is not None:
+            total = first.last_page * per_page
+        if total is not None and remaining is not None:
+            total = min(total, first_size + remaining)
+
+        def fetch(page: int) -> list[ReceivedDocument]:
+            expenses = self._list_page(page, per_page, q=q, sort=sort).data or []
+            return expenses[skip:] if page == start_page else expenses
+
+        if total is None:
+            # No pagination metadata: walk pages until an empty one
+            pages = map(fetch, count(start_page))
+            futures = None
+        else:
+            last_page = -(-total // per_page)
+            futures = [
+                self.executor.submit(fetch, page)
+                for page in range(start_page, last_page + 1)
+            ]
+            # Results are yielded in page order
+            pages = (future.result() for future in futures)
+
+        try:
+            for expenses in pages:
+                if remaining is not None:
+                    expenses = expenses[:remaining]
+                    remaining -= len(expenses)
+                if expenses:
+                    yield expenses
+                if (futures is None and not expenses) or remaining == 0:
+                    return
+        finally:
+            # Drop the pages nobody will read
+            if futures is not None:
+                for future in futures:
+                    future.cancel()
+
+    def _list_page(
+        self,
+        page: int,
+        per_page: int,
+        *,
+        q: str | None = None,
+        sort: str | None = None,
+    ) -> ListReceivedDocumentsResponse:
+        """Fetch a single page of expenses."""
+        response = self._call(
+            self._api.list_received_documents_with_http_info,
+            company_id=self.company_id,
+            type="expense",
+            q=q,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+        )
+        return response.data
 
     def get_expense(self, document_id: int) -> ReceivedDocument:
         """Get a single expense by ID."""
-        api = self._get_api()
-        response = api.get_received_document_with_http_info(
+        api = self._api
+        response = self._call(
+            api.get_received_document_with_http_info,
             company_id=self.company_id,
             document_id=document_id,
         )
-        self._update_quota(response.headers)
-        return response.data.data
+        expense = response.data.data
+        self._cache_expense(document_id, expense)
+        return expense
+
+    def _get_expense_for_update(self, document_id: int) -> ReceivedDocument:
+        """Get an expense to modify, reusing a recent fetch if there is one.
+
+        Returns a private copy, so the caller can mutate it freely.
+        """
+        with self._expense_cache_lock:
+            cached = self._expense_cache.pop(document_id, None)
+        if cached is not None:
+            fetched_at, expense = cached
+            if time.monotonic() - fetched_at < self.EXPENSE_CACHE_TTL:
+                return expense.model_copy(deep=True)
+        return self.get_expense(document_id).model_copy(deep=True)
 
     def list_payment_accounts(self) -> list[PaymentAccount]:
         """
         List available payment accounts.
 
+        Results are cached for PAYMENT_ACCOUNTS_TTL seconds
+        (see invalidate_payment_accounts).
+
         Returns:
             List of payment accounts (bank accounts, cash, cards, etc.)
         """
-        api = self._get_info_api()
-        response = api.list_payment_accounts_with_http_info(company_id=self.company_id)
-        self._update_quota(response.headers)
-        return response.data.data or []
+        cached = FICClient._payment_accounts_cache.get(self.company_id)
+        if cached is not None:
+            fetched_at, accounts = cached
+            if time.monotonic() - fetched_at < self.PAYMENT_ACCOUNTS_TTL:
+                return list(accounts)
+
+        api = self._info_api
+        response = self._call(
+            api.list_payment_accounts_with_http_info,
+            company_id=self.company_id,
+        )
+        accounts = response.data.data or []
+        FICClient._payment_accounts_cache[self.company_id] = (time.monotonic(), accounts)
+        return list(accounts)
+
+    @classmethod
+    def invalidate_payment_accounts(cls) -> None:
+        """Forget cached payment accounts (e.g. after a configuration change)."""
+        cls._payment_accounts_cache.clear()
 
     def create_expense(
         self,
@@ -234,7 +565,7 @@ class FICClient:
         Returns:
             Created expense document
         """
-        api = self._get_api()
+        api = self._api
 
         expense = ReceivedDocument(
             type=ReceivedDocumentType.EXPENSE,
@@ -250,12 +581,16 @@ class FICClient:
         )
 
         request = CreateReceivedDocumentRequest(data=expense)
-        response = api.create_received_document_with_http_info(
+        response = self._call(
+            api.create_received_document_with_http_info,
             company_id=self.company_id,
             create_received_document_request=request,
         )
-        self._update_quota(response.headers)
-        return response.data.data
+        created = response.data.data
+        # The response is the full document: keep it, so an immediate update skips the GET
+        if created.id is not None:
+            self._cache_expense(created.id, created)
+        return created
 
     def update_expense(
         self,
@@ -272,16 +607,18 @@ class FICClient:
         Returns:
             Updated expense document
         """
-        api = self._get_api()
+        api = self._api
 
         request = ModifyReceivedDocumentRequest(data=expense)
-        response = api.modify_received_document_with_http_info(
+        response = self._call(
+            api.modify_received_document_with_http_info,
             company_id=self.company_id,
             document_id=document_id,
             modify_received_document_request=request,
         )
-        self._update_quota(response.headers)
-        return response.data.data
+        updated = response.data.data
+        self._cache_expense(document_id, updated)
+        return updated
 
     def mark_expense_paid(
         self,
@@ -303,37 +640,215 @@ class FICClient:
                       (falls back to expense date if due_date is also missing)
             installment_index: If provided, only mark this installment as paid (1-indexed)
 
+        Returns:
+            Updated expense document
+        """
+        installment_indexes = None if installment_index is None else [installment_index]
+        return self.mark_installments_paid(
+            document_id,
+            payment_account_id,
+            installment_indexes,
+            paid_date=paid_date,
+        )
+
+    def mark_expenses_paid_bulk(
+        self,
+        items: list[tuple[int, date | None]],
+        payment_account_id: int,
+        installment_index: int | None = None,
+        on_done: Callable[[int, Exception | None], None] | None = None,
+    ) -> dict[int, Exception]:
+        """
+        Mark several expenses as paid concurrently.
+
+        Each expense is handled as in mark_expense_paid(); a failure does not
+        stop the others.
+
+        Args:
+            items: (document_id, paid_date) pairs, paid_date as in mark_expense_paid()
+            payment_account_id: ID of the payment account (bank, cash, card, etc.)
+            installment_index: If provided, only mark this installment as paid (1-indexed)
+            on_done: Called with (document_id, error or None) as each expense finishes
+
+        Returns:
+            Errors keyed by document ID (empty if every expense was updated)
+        """
+        failures: dict[int, Exception] = {}
+        if not items:
+            return failures
+        futures = {
+            self.executor.submit(
+                self.mark_expense_paid,
+                document_id=document_id,
+                payment_account_id=payment_account_id,
+                paid_date=paid_date,
+                installment_index=installment_index,
+            ): document_id
+            for document_id, paid_date in items
+        }
+        for future in as_completed(futures):
+            document_id = futures[future]
+            error = future.exception()
+            if error is not None:
+                failures[document_id] = error
+            if on_done is not None:
+                on_done(document_id, error)
+        return failures
+
+    def mark_installments_paid(
+        self,
+        document_id: int,
+        payment_account_id: int,
+        installment_indexes: Iterable[int] | None = None,
+        paid_date: date | None = None,
+    ) -> ReceivedDocument:
+        """
+        Mark several installments of an expense as paid with a single update.
+
+        Args:
+            document_id: ID of the expense
+            payment_account_id: ID of the payment account (bank, cash, card, etc.)
+            installment_indexes: Installments to mark as paid (1-indexed).
+                                 If None, all unpaid installments are marked.
+            paid_date: Date of payment. If None, each installment uses its own due_date
+                      (falls back to expense date if due_date is also missing)
+
         Returns:
             Updated expense document
         """
         payment_account = PaymentAccount(id=payment_account_id)
+        selected = None if installment_indexes is None else set(installment_indexes)
 
-        # Get current expense
-        expense = self.get_expense(document_id)
+        # Get current expense (skips the GET if it was fetched moments ago)
+        expense = self._get_expense_for_update(document_id)
 
         if not expense.payments_list:
             raise ValueError(f"Expense {document_id} has no payment schedule")
 
         # Update payments
-        for i, payment in enumerate(expense.payments_list):
-            if installment_index is not None:
-                # Only update specific installment (1-indexed)
-                if i + 1 == installment_index:
-                    payment.status = "paid"
-                    # Use provided date, or installment's due_date, or expense date
-                    payment.paid_date = paid_date or payment.due_date or expense.var_date
-                    payment.payment_account = payment_account
-            else:
+        for i, payment in enumerate(expense.payments_list, 1):
+            if selected is None:
                 # Update all unpaid installments
-                if payment.status != "paid":
-                    payment.status = "paid"
-                    # Each installment uses its own due_date if no explicit date provided
-                    payment.paid_date = paid_date or payment.due_date or expense.var_date
-                    payment.payment_account = payment_account
+                if payment.status == "paid":
+                    continue
+            elif i not in selected:
+                continue
+
+            payment.status = "paid"
+            # Use provided date, or installment's due_date, or expense date
+            payment.paid_date = paid_date or payment.due_date or expense.var_date
+            payment.payment_account = payment_account
 
         return self.update_expense(document_id, expense)
 
 
+@lru_cache(maxsize=1)
+def get_client() -> FICClient:
+    """Get the shared client, created on first use.
+
+    Screens and dialogs share one client, so its connection pool stays warm
+    across operations. Raises ValueError if credentials are missing.
+    """
+    return FICClient()
+
+
+def reset_client() -> None:
+    """Close the shared client; the next get_client() builds a new one."""
+    if get_client.cache_info().currsize:
+        get_client().close()
+    get_client.cache_clear()
+
+
+class AsyncFICClient:
+    """asyncio front-end for FICClient.
+
+    Runs the blocking SDK calls in worker threads, at most MAX_CONCURRENCY
+    at a time, so several requests can be awaited together, e.g.
+    `await asyncio.gather(*(client.get_expense(i) for i in ids))`.
+    Requests share the FICClient connection pool and rate limiter.
+    """
+
+    MAX_CONCURRENCY = 8
+
+    def __init__(self, client: FICClient | None = None) -> None:
+        """Wrap an existing client, or create one from environment variables."""
+        # A client passed in (e.g. get_client()) is shared and stays open
+        self._owns_client = client is None
+        self.client = client or FICClient()
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+    async def __aenter__(self) -> "AsyncFICClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    async def _run(self, func, /, *args, **kwargs):
+        """Run a blocking client method in a worker thread."""
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def list_expenses(self, **kwargs) -> list[ReceivedDocument]:
+        """See FICClient.list_expenses."""
+        return await self._run(self.client.list_expenses, **kwargs)
+
+    async def get_expense(self, document_id: int) -> ReceivedDocument:
+        """See FICClient.get_expense."""
+        return await self._run(self.client.get_expense, document_id)
+
+    async def list_payment_accounts(self) -> list[PaymentAccount]:
+        """See FICClient.list_payment_accounts."""
+        return await self._run(self.client.list_payment_accounts)
+
+    async def create_expense(self, **kwargs) -> ReceivedDocument:
+        """See FICClient.create_expense."""
+        return await self._run(self.client.create_expense, **kwargs)
+
+    async def update_expense(
+        self, document_id: int, expense: ReceivedDocument
+    ) -> ReceivedDocument:
+        """See FICClient.update_expense."""
+        return await self._run(self.client.update_expense, document_id, expense)
+
+    async def mark_expense_paid(self, document_id: int, **kwargs) -> ReceivedDocument:
+        """See FICClient.mark_expense_paid."""
+        return await self._run(self.client.mark_expense_paid, document_id, **kwargs)
+
+
+# Payment status of newly created installments
+_STATUS_NOT_PAID = "not_paid"
+
+
+def iter_payment_installments(
+    total_amount: float,
+    num_installments: int,
+    start_date: date,
+) -> Iterator[ReceivedDocumentPaymentsListItem]:
+    """
+    Yield payment installments for an expense, one at a time.
+
+    Installments are due on the same day of consecutive months, starting
+    from start_date (see utils.generate_installment_dates).
+
+    Args:
+        total_amount: Total gross amount
+        num_installments: Number of installments
+        start_date: Due date of the first installment
+
+    Yields:
+        Payment installment items
+    """
+    # Values are already well-typed, so skip pydantic validation
+    construct = ReceivedDocumentPaymentsListItem.model_construct
+    for i, amount in enumerate(split_amount(total_amount, num_installments)):
+        yield construct(
+            amount=amount,
+            due_date=add_months(start_date, i),
+            status=_STATUS_NOT_PAID,
+        )
+
+
 def create_payment_installments(
     total_amount: float,
     num_installments: int,
@@ -342,6 +857,9 @@ def create_payment_installments(
     """
     Create payment installments for an expense.
 
+    The SDK's payments_list must be a list, so this materializes
+    iter_payment_installments().
+
     Args:
         total_amount: Total gross amount
         num_installments: Number of installments
@@ -350,16 +868,4 @@ def create_payment_installments(
     Returns:
         List of payment installment items
     """
-    from .utils import generate_installment_dates, split_amount
-
-    dates = generate_installment_dates(start_date, num_installments)
-    amounts = split_amount(total_amount, num_installments)
-
-    return [
-        ReceivedDocumentPaymentsListItem(
-            amount=amount,
-            due_date=due_date,
-            status="not_paid",
-        )
-        for amount, due_date in zip(amounts, dates)
-    ]
+    return list(iter_payment_installments(total_amount, num_installments, start_date))
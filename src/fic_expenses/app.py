@@ -1,14 +1,19 @@
 """Main FIC Expenses TUI Application."""
 
+from itertools import compress
+from operator import attrgetter, not_
+
 from textual import work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Static, Footer
 
+from fattureincloud_python_sdk.exceptions import ApiException
 from fattureincloud_python_sdk.models import ReceivedDocument
 
-from .api import FICClient, QuotaInfo
+from .api import FICClient, QuotaInfo, get_client, reset_client
 from .widgets.quota_display import QuotaDisplay
 from .widgets.filter_bar import FilterBar
 from .widgets.expenses_table import ExpensesTable
@@ -16,7 +21,9 @@ from .widgets.summary_bar import SummaryBar
 from .widgets.stats_panel import StatsPanel
 from .screens.loading import LoadingScreen
 from .screens.error import ErrorScreen
-from .screens.settings import SettingsScreen
+
+# Fields read for every loaded expense (one call instead of three attribute reads)
+_expense_amounts = attrgetter("amount_net", "amount_vat", "next_due_date")
 
 
 class FICExpensesApp(App):
@@ -75,15 +82,29 @@ class FICExpensesApp(App):
         Binding("x", "quit", "Exit", show=True),
     ]
 
+    # Size of the first page when streaming many pages (faster first paint)
+    FIRST_PAGE_SIZE = 25
+
     def __init__(self) -> None:
         super().__init__()
         self._expenses: list[ReceivedDocument] = []
+        # Per-expense columns parallel to _expenses, computed once per load
+        self._gross: list[float] = []
+        self._paid: list[bool] = []
         self._filtered_expenses: list[ReceivedDocument] = []
+        self._filtered_gross: list[float] = []  # Parallel to _filtered_expenses
+        self._filtered_by_id: dict[int, ReceivedDocument] = {}  # Index of _filtered_expenses
+        self._totals: dict[str, float] = {}  # Running summary totals of _filtered_expenses
         self._quota: QuotaInfo | None = None
         self._current_filters: dict = {}  # Track current filter state
         # Worker parameters (stored before worker starts)
         self._load_limit: int | None = 50  # None means fetch all
         self._load_query: str | None = None
+        self._load_status_query: str | None = None
+        # Cleared if the API rejects the status (next_due_date) condition
+        self._status_query_supported = True
+        # Status condition the API applied to the loaded expenses, if any
+        self._api_status_query: str | None = None
 
     def compose(self) -> ComposeResult:
         """Create the main application layout."""
@@ -108,16 +129,24 @@ class FICExpensesApp(App):
         """Load expenses when app starts."""
         self.load_expenses()
 
-    def load_expenses(self, limit: int | None = 50, query: str | None = None) -> None:
+    def load_expenses(
+        self,
+        limit: int | None = 50,
+        query: str | None = None,
+        status_query: str | None = None,
+    ) -> None:
         """Load expenses - stores params and dispatches to worker.
 
         Args:
             limit: Number of expenses to fetch. None means fetch all.
             query: FIC API query string for filtering.
+            status_query: FIC API condition for the paid/unpaid filter. Dropped
+                (status is then filtered client-side only) if the API rejects it.
         """
         # Store parameters for worker to read (avoids @work decorator arg issues)
         self._load_limit = limit
         self._load_query = query
+        self._load_status_query = status_query if self._status_query_supported else None
         self._do_load_expenses()
 
     @work(thread=True, exclusive=True)
@@ -126,29 +155,61 @@ class FICExpensesApp(App):
         # Read parameters stored before worker started
         limit = self._load_limit
         query = self._load_query
+        status_query = self._load_status_query
         fetch_all = limit is None
 
         # Show loading indicator
         if fetch_all:
             msg = "Fetching all expenses..."
-        elif query:
+        elif query or status_query:
             msg = "Applying filters..."
         else:
             msg = f"Loading {limit} expenses..."
         self.call_from_thread(self.push_screen, LoadingScreen(msg))
 
+        # Many pages: show a small first page right away, stream the rest in
+        streaming = limit is None or limit > FICClient.MAX_PER_PAGE
+        first_page_size = self.FIRST_PAGE_SIZE if streaming else limit
+        worker = get_current_worker()
+        shown = False
+
         try:
-            client = FICClient()
-            expenses = client.list_expenses(limit=limit, sort="-date", q=query)
-            self._expenses = expenses
+            client = get_client()
+            full_query = " AND ".join(c for c in (query, status_query) if c) or None
+            try:
+                pages = client.iter_expense_pages(
+                    q=full_query, sort="-date", limit=limit, first_page_size=first_page_size
+                )
+                first = next(pages, [])
+            except ApiException as e:
+                if e.status != 400 or not status_query:
+                    raise
+                # API rejected the status condition: filter client-side from now on
+                self._status_query_supported = False
+                status_query = None
+                pages = client.iter_expense_pages(
+                    q=query, sort="-date", limit=limit, first_page_size=first_page_size
+                )
+                first = next(pages, [])
+
+            # Replace the table with the first page and remove loading
+            self.call_from_thread(
+                self._show_expenses, *self._expense_columns(first), status_query
+            )
+            shown = True
+
+            # Append the remaining pages as they arrive
+            for page in pages:
+                if worker.is_cancelled:
+                    return
+                self.call_from_thread(self._append_expenses, *self._expense_columns(page))
 
             # Update quota
             if client.last_quota:
                 self._quota = client.last_quota
                 self.call_from_thread(self._update_quota_display)
 
-            # Update expenses and remove loading
-            self.call_from_thread(self._show_expenses)
+            self.call_from_thread(self._finish_loading)
 
         except ValueError as e:
             # Missing credentials
@@ -159,6 +220,10 @@ class FICExpensesApp(App):
                 str(e),
             )
         except Exception as e:
+            if shown:
+                # Keep the expenses loaded so far
+                self.call_from_thread(self._finish_loading, str(e))
+                return
             self.call_from_thread(
                 self._show_error,
                 "Connection Error",
@@ -166,19 +231,40 @@ class FICExpensesApp(App):
                 str(e),
             )
 
-    def _show_expenses(self) -> None:
-        """Show expenses with loaded data."""
+    @staticmethod
+    def _expense_columns(
+        expenses: list[ReceivedDocument],
+    ) -> tuple[list[ReceivedDocument], list[float], list[bool]]:
+        """Precompute the columns used by filtering and totals (off the UI thread)."""
+        gross = []
+        paid = []
+        add_gross = gross.append
+        add_paid = paid.append
+        for net, vat, next_due in map(_expense_amounts, expenses):
+            add_gross((net or 0) + (vat or 0))
+            add_paid(next_due is None)
+        return expenses, gross, paid
+
+    def _show_expenses(
+        self,
+        expenses: list[ReceivedDocument],
+        gross: list[float],
+        paid: list[bool],
+        status_query: str | None,
+    ) -> None:
+        """Show the first page of loaded expenses.
+
+        status_query is the status condition the API applied, if any.
+        """
         # Pop loading screen
         self.pop_screen()
 
-        # Show notification with count
-        count = len(self._expenses)
-        limit = self._load_limit
-        mode = "all" if limit is None else f"limit {limit}"
-        self.notify(f"Loaded {count} expenses ({mode})")
+        self._expenses, self._gross, self._paid = expenses, gross, paid
+        self._api_status_query = status_query
 
-        # Apply status filter client-side (other filters already applied via API)
+        # Apply status filter client-side (skipped when the API already applied it)
         self._apply_status_filter()
+        self._update_loading_progress(loading=True)
 
         # Focus the expenses table for keyboard navigation
         try:
@@ -187,6 +273,50 @@ class FICExpensesApp(App):
         except Exception:
             pass
 
+    def _append_expenses(
+        self, expenses: list[ReceivedDocument], gross: list[float], paid: list[bool]
+    ) -> None:
+        """Append a further page of loaded expenses to the table and totals."""
+        self._expenses.extend(expenses)
+        self._gross.extend(gross)
+        self._paid.extend(paid)
+
+        filtered = self._filter_expenses(expenses, gross, paid)
+        table = self.query_one("#expenses-table", ExpensesTable)
+        # Queued behind any pending table load (see _apply_status_filter)
+        self.call_later(table.append_expenses, filtered)
+        self.call_later(self._update_summary)
+        self._update_loading_progress(loading=True)
+
+    def _finish_loading(self, error: str | None = None) -> None:
+        """Finish a load: notify and refresh the stats for the full data set."""
+        self._update_loading_progress(loading=False)
+
+        count = len(self._expenses)
+        if error:
+            self.notify(
+                f"Loaded {count} expenses, then failed: {error}",
+                severity="error",
+            )
+        else:
+            # Show notification with count
+            limit = self._load_limit
+            mode = "all" if limit is None else f"limit {limit}"
+            self.notify(f"Loaded {count} expenses ({mode})")
+
+        self.call_later(self._update_stats_panel)
+
+    def _update_loading_progress(self, loading: bool) -> None:
+        """Show how many expenses have been loaded so far in the header."""
+        try:
+            title = self.query_one("#app-title", Static)
+            if loading:
+                title.update(f"FIC Expenses [dim]· loading… {len(self._expenses)}[/]")
+            else:
+                title.update("FIC Expenses")
+        except Exception:
+            pass
+
     def _show_error(self, title: str, message: str, detail: str) -> None:
         """Show error screen."""
         # Pop loading screen if present
@@ -211,64 +341,81 @@ class FICExpensesApp(App):
         self._update_quota_display()
 
     def _apply_status_filter(self) -> None:
-        """Apply status filter client-side (API doesn't support status filtering)."""
-        status = self._current_filters.get("status", "all")
-
-        filtered = self._expenses
-
-        # Filter by status (client-side only - API doesn't support next_due_date filter)
-        if status == "paid":
-            filtered = [e for e in filtered if e.next_due_date is None]
-        elif status == "unpaid":
-            filtered = [e for e in filtered if e.next_due_date is not None]
-
-        self._filtered_expenses = filtered
+        """Apply status filter client-side (fallback if the API can't filter by status)."""
+        self._filtered_expenses = []
+        self._filtered_gross = []
+        self._filtered_by_id = {}
+        self._totals = {
+            "unpaid_count": 0,
+            "unpaid_total": 0.0,
+            "paid_count": 0,
+            "paid_total": 0.0,
+        }
+        filtered = self._filter_expenses(self._expenses, self._gross, self._paid)
 
-        # Update table
+        # Update the widgets in separate callbacks, so the screen can repaint
+        # in between (callbacks run in order, after pending messages)
         table = self.query_one("#expenses-table", ExpensesTable)
-        table.load_expenses(filtered)
-
-        # Update summary
-        self._update_summary()
-
-        # Update stats panel
-        self._update_stats_panel()
+        self.call_later(table.load_expenses, filtered)
+        self.call_later(self._update_summary)
+        self.call_later(self._update_stats_panel)
+
+    def _filter_expenses(
+        self, expenses: list[ReceivedDocument], gross: list[float], paid: list[bool]
+    ) -> list[ReceivedDocument]:
+        """Filter expenses by status, adding them to the filtered list and totals."""
+        status = self._current_filters.get("status", "all")
+        # None keeps every expense, otherwise keep only paid (True) or unpaid (False)
+        keep_paid = {"paid": True, "unpaid": False}.get(status)
+        if keep_paid is not None and FilterBar.STATUS_QUERIES[status] == self._api_status_query:
+            # The API already returned only expenses with this status
+            keep_paid = None
+
+        # Select and sum through the precomputed paid mask with compress(),
+        # without touching the expense models (paid means no next_due_date)
+        if keep_paid is None:
+            filtered = list(expenses)
+            filtered_gross = list(gross)
+        else:
+            mask = paid if keep_paid else list(map(not_, paid))
+            filtered = list(compress(expenses, mask))
+            filtered_gross = list(compress(gross, mask))
+
+        paid_count = unpaid_count = 0
+        paid_total = unpaid_total = 0.0
+        if keep_paid is not False:
+            paid_count = sum(paid)
+            paid_total = sum(compress(gross, paid), 0.0)
+        if keep_paid is not True:
+            unpaid_count = len(paid) - sum(paid)
+            unpaid_total = sum(compress(gross, map(not_, paid)), 0.0)
+
+        self._filtered_expenses.extend(filtered)
+        self._filtered_gross.extend(filtered_gross)
+        self._filtered_by_id.update((e.id, e) for e in filtered)
+
+        totals = self._totals
+        totals["unpaid_count"] += unpaid_count
+        totals["unpaid_total"] += unpaid_total
+        totals["paid_count"] += paid_count
+        totals["paid_total"] += paid_total
+        return filtered
 
     def _update_summary(self) -> None:
-        """Update summary bar with current statistics."""
+        """Update the summary bar from the running totals."""
+        totals = self._totals
         summary_bar = self.query_one("#summary-bar", SummaryBar)
-
-        total_count = len(self._filtered_expenses)
-        unpaid_count = 0
-        unpaid_total = 0.0
-        paid_count = 0
-        paid_total = 0.0
-
-        for expense in self._filtered_expenses:
-            gross = (expense.amount_net or 0) + (expense.amount_vat or 0)
-            if expense.next_due_date is not None:
-                unpaid_count += 1
-                unpaid_total += gross
-            else:
-                paid_count += 1
-                paid_total += gross
-
-        total_amount = unpaid_total + paid_total
-
         summary_bar.update_stats(
-            total_count=total_count,
-            unpaid_count=unpaid_count,
-            unpaid_total=unpaid_total,
-            paid_count=paid_count,
-            paid_total=paid_total,
-            total_amount=total_amount,
+            total_count=len(self._filtered_expenses),
+            total_amount=totals["unpaid_total"] + totals["paid_total"],
+            **totals,
         )
 
     def _update_stats_panel(self) -> None:
         """Update stats panel with current filtered expenses."""
         try:
             stats_panel = self.query_one("#stats-panel", StatsPanel)
-            stats_panel.update_stats(self._filtered_expenses)
+            stats_panel.update_stats(self._filtered_expenses, self._filtered_gross)
         except Exception:
             pass
 
@@ -285,9 +432,10 @@ class FICExpensesApp(App):
         # Build API query from filters
         filter_bar = self.query_one("#filter-bar", FilterBar)
         query = filter_bar.build_api_query()
+        status_query = filter_bar.build_status_query()
 
         # Reload data from API with filters and limit
-        self.load_expenses(limit=event.limit, query=query)
+        self.load_expenses(limit=event.limit, query=query, status_query=status_query)
 
     def on_expenses_table_selection_changed(
         self, event: ExpensesTable.SelectionChanged
@@ -324,12 +472,11 @@ class FICExpensesApp(App):
         from .dialogs.pay import PayDialog
 
         # Get selected expenses
-        expenses = []
-        for expense_id in event.expense_ids:
-            for e in self._filtered_expenses:
-                if e.id == expense_id:
-                    expenses.append(e)
-                    break
+        expenses = [
+            self._filtered_by_id[expense_id]
+            for expense_id in event.expense_ids
+            if expense_id in self._filtered_by_id
+        ]
 
         if expenses:
             self.push_screen(PayDialog(expenses), self._on_pay_dialog_result)
@@ -361,6 +508,7 @@ class FICExpensesApp(App):
 
     def action_show_settings(self) -> None:
         """Show settings screen."""
+        from .screens.settings import SettingsScreen
         self.push_screen(SettingsScreen())
 
     def action_focus_search(self) -> None:
@@ -379,7 +527,11 @@ class FICExpensesApp(App):
 def main() -> None:
     """Main entry point for the TUI application."""
     app = FICExpensesApp()
-    app.run()
+    try:
+        app.run()
+    finally:
+        # Release the shared client's pooled connections
+        reset_client()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""Configuration loaded from .env and the process environment."""
+
+import os
+from dataclasses import dataclass
+from functools import cache
+
+from dotenv import load_dotenv
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """FIC credentials and defaults."""
+
+    access_token: str | None
+    company_id: str | None
+    default_account_id: int | None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read settings from environment variables."""
+        account_id = os.getenv("FIC_DEFAULT_ACCOUNT_ID")
+        try:
+            default_account_id = int(account_id) if account_id else None
+        except ValueError:
+            default_account_id = None
+
+        return cls(
+            access_token=os.getenv("FIC_ACCESS_TOKEN"),
+            company_id=os.getenv("FIC_COMPANY_ID"),
+            default_account_id=default_account_id,
+        )
+
+
+@cache
+def get_settings() -> Settings:
+    """Get the settings, loading .env on first use."""
+    load_dotenv()
+    return Settings.from_env()
+
+
+def reload_settings() -> None:
+    """Forget the cached settings (call after changing the environment)."""
+    get_settings.cache_clear()
@@ -1,17 +1,119 @@
 """Create expense wizard dialog."""
 
+import math
+import re
+import time
+from concurrent.futures import as_completed
 from datetime import date
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache, partial
+from typing import Callable, Iterator
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.widget import Widget
 from textual.widgets import Static, Button, Input, Label, Select
 from textual.reactive import reactive
+from textual.timer import Timer
 from rich.text import Text
 
-from ...api import FICClient, create_payment_installments
-from ...utils import generate_installment_dates, split_amount
+from ...api import create_payment_installments, get_client
+from ...utils import (
+    add_months,
+    end_of_month,
+    format_date,
+    generate_installment_dates,
+    parse_date,
+    split_amount,
+)
+
+
+# Select options (label, value)
+_VAT_OPTIONS = (
+    ("22%", "22"),
+    ("10%", "10"),
+    ("4%", "4"),
+    ("0%", "0"),
+)
+_RECURRENCE_ENABLED_OPTIONS = (
+    ("No - single expense", "no"),
+    ("Yes - create recurring expenses", "yes"),
+)
+_RECURRENCE_EVERY_OPTIONS = (
+    ("1 month", "1"),
+    ("2 months", "2"),
+    ("3 months (quarterly)", "3"),
+    ("4 months", "4"),
+    ("6 months (semi-annual)", "6"),
+    ("12 months (annual)", "12"),
+    ("Custom...", "custom"),
+)
+
+# Labels of required fields (shared; Labels don't modify their content)
+_SUPPLIER_LABEL = Text.assemble("Supplier ", ("*", "bold red"))
+_NET_AMOUNT_LABEL = Text.assemble("Net Amount (before VAT) ", ("*", "bold red"))
+
+_CENT = Decimal("0.01")
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_iso(value: str) -> date | None:
+    """Parse a YYYY-MM-DD date, or return None if it isn't one.
+
+    Input that is still being typed (e.g. "2024-1") fails the regex without
+    raising and catching a ValueError on every keystroke.
+    """
+    if not _ISO_DATE_RE.fullmatch(value):
+        return None
+    try:
+        return parse_date(value)
+    except ValueError:  # Right shape, impossible date (e.g. 2024-02-30)
+        return None
+
+
+@lru_cache(maxsize=256)
+def _vat_gross(amount: str, vat_rate: str) -> tuple[Decimal, Decimal]:
+    """VAT and gross amounts for a net amount and VAT rate given as text.
+
+    Both are rounded half-up to the cent in Decimal. Every amount the wizard
+    shows or saves comes from here, so previews match the created expense.
+    Raises ValueError if amount isn't a number.
+    """
+    try:
+        net = Decimal(amount)
+        if not net.is_finite():
+            raise InvalidOperation
+        vat = (net * Decimal(vat_rate) / 100).quantize(_CENT, ROUND_HALF_UP)
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid amount: {amount!r}") from e
+    return vat, (net + vat).quantize(_CENT, ROUND_HALF_UP)
+
+
+def _calc_vat_gross(amount: str, vat_rate: str) -> tuple[str, str]:
+    """Formatted VAT and gross amounts for a net amount and VAT rate as typed."""
+    vat, gross = _vat_gross(amount, vat_rate)
+    return f"€{vat:,.2f}", f"€{gross:,.2f}"
+
+
+@lru_cache(maxsize=64)
+def _installment_dates(first_due: date, count: int) -> tuple[str, ...]:
+    """Formatted due dates of the installments (cached for the previews)."""
+    return tuple(format_date(d) for d in generate_installment_dates(first_due, count))
+
+
+@lru_cache(maxsize=64)
+def _installment_amounts(gross_cents: int, count: int) -> tuple[str, ...]:
+    """Formatted amounts of the installments (cached for the previews)."""
+    return tuple(f"€{amount:,.2f}" for amount in split_amount(gross_cents / 100, count))
+
+
+@lru_cache(maxsize=64)
+def _compute_recurrence_dates(expense_date: date, every_months: int, count: int) -> tuple[date, ...]:
+    """Dates of the first count occurrences (cached for the previews)."""
+    return tuple(add_months(expense_date, i * every_months) for i in range(count))
 
 
 class CreateWizard(ModalScreen[bool]):
@@ -149,6 +251,10 @@ class CreateWizard(ModalScreen[bool]):
         display: block;
     }
 
+    CreateWizard .recurrence-options {
+        height: auto;
+    }
+
     CreateWizard .recurrence-disabled {
         color: $text-muted;
     }
@@ -170,6 +276,12 @@ class CreateWizard(ModalScreen[bool]):
     # Total number of steps in the wizard
     TOTAL_STEPS = 5
 
+    # Seconds of typing pause before a preview is refreshed
+    PREVIEW_DELAY = 0.15
+
+    # Minimum seconds between progress updates while creating a series
+    PROGRESS_INTERVAL = 0.1
+
     # Form data
     supplier: str = ""
     description: str = ""
@@ -180,6 +292,10 @@ class CreateWizard(ModalScreen[bool]):
     installments: int = 1
     first_due: str = ""
 
+    # Dates above as parsed by _save_current_step_data (first_due None = default)
+    expense_date_value: date | None = None
+    first_due_value: date | None = None
+
     # Recurrence data
     recurrence_enabled: bool = False
     recurrence_every_months: int = 3  # Every N months (0 = custom mode)
@@ -188,7 +304,16 @@ class CreateWizard(ModalScreen[bool]):
 
     def __init__(self) -> None:
         super().__init__()
-        self.expense_date = date.today().strftime("%Y-%m-%d")
+        self.expense_date_value = date.today()
+        self.expense_date = self.expense_date_value.isoformat()
+        self._preview_timer: Timer | None = None
+        self._last_values: dict[str, object] = {}  # Last value seen per Input/Select id
+        self._widgets: dict[str, Widget] = {}  # Current step's widgets by id
+        self._tabs: list[Static] = []
+        self._content_generation = 0  # Bumped by every step content update
+        # Preview widgets currently shown at the end of steps 3 and 4
+        self._installment_preview: list[Widget] = []
+        self._recurrence_preview: list[Widget] = []
 
     def compose(self) -> ComposeResult:
         """Create wizard layout."""
@@ -220,6 +345,14 @@ class CreateWizard(ModalScreen[bool]):
 
     def on_mount(self) -> None:
         """Focus first input when wizard opens."""
+        # Widgets that live as long as the wizard, looked up once
+        self._tabs = [self.query_one(f"#tab-{i}", Static) for i in range(1, self.TOTAL_STEPS + 1)]
+        self._content = self.query_one("#wizard-content", VerticalScroll)
+        self._error = self.query_one("#error-message", Static)
+        self._processing = self.query_one("#processing", Static)
+        self._buttons = self.query_one("#wizard-buttons", Horizontal)
+        self._next_btn = self.query_one("#next-btn", Button)
+        self._widgets = {widget.id: widget for widget in self._content.children if widget.id}
         self._focus_first_input()
 
     def _focus_first_input(self) -> None:
@@ -230,29 +363,31 @@ class CreateWizard(ModalScreen[bool]):
     def _do_focus_first_input(self) -> None:
         """Actually focus the first input (called after delay)."""
         try:
-            content = self.query_one("#wizard-content", VerticalScroll)
+            content = self._content
             # Find first Input or Select widget
             for widget in content.query(Input):
-                widget.focus()
-                return
+                # Skip inputs inside hidden option groups
+                if all(node.display for node in widget.ancestors_with_self):
+                    widget.focus()
+                    return
             for widget in content.query(Select):
                 widget.focus()
                 return
             # If no input/select (like Review step), focus the Next button
-            self.query_one("#next-btn", Button).focus()
+            self._next_btn.focus()
         except Exception:
             pass
 
     def _build_step_1(self) -> list:
         """Build step 1 widgets: Basic info."""
         return [
-            Label(Text.assemble("Supplier ", ("*", "bold red")), classes="form-label-first"),
+            Label(_SUPPLIER_LABEL, id="supplier-label", classes="form-label-first"),
             Input(value=self.supplier, id="supplier-input", placeholder="e.g., Amazon AWS"),
-            Label("Description", classes="form-label"),
+            Label("Description", id="description-label", classes="form-label"),
             Input(value=self.description, id="description-input", placeholder="Optional"),
-            Label("Category", classes="form-label"),
+            Label("Category", id="category-label", classes="form-label"),
             Input(value=self.category, id="category-input", placeholder="e.g., Software"),
-            Label("Expense Date", classes="form-label"),
+            Label("Expense Date", id="date-label", classes="form-label"),
             Input(value=self.expense_date, id="date-input", placeholder="YYYY-MM-DD"),
         ]
 
@@ -261,33 +396,31 @@ class CreateWizard(ModalScreen[bool]):
         for widget in self._build_step_1():
             yield widget
 
+    def _amounts(self) -> tuple[Decimal, Decimal]:
+        """VAT and gross amounts of the saved net amount and VAT rate."""
+        return _vat_gross(str(self.amount_net), str(self.vat_rate))
+
     def _build_step_2(self) -> list:
         """Build step 2 widgets: Amount."""
-        vat_amount = self.amount_net * self.vat_rate / 100
-        gross = self.amount_net + vat_amount
+        vat_amount, gross = _calc_vat_gross(str(self.amount_net), str(self.vat_rate))
 
         return [
-            Label(Text.assemble("Net Amount (before VAT) ", ("*", "bold red")), classes="form-label-first"),
+            Label(_NET_AMOUNT_LABEL, id="amount-label", classes="form-label-first"),
             Input(
                 value=str(self.amount_net) if self.amount_net else "",
                 id="amount-input",
                 placeholder="e.g., 100.00",
             ),
-            Label("VAT Rate (%)", classes="form-label"),
+            Label("VAT Rate (%)", id="vat-label", classes="form-label"),
             Select(
-                [
-                    ("22%", "22"),
-                    ("10%", "10"),
-                    ("4%", "4"),
-                    ("0%", "0"),
-                ],
+                _VAT_OPTIONS,
                 value=str(int(self.vat_rate)),
                 id="vat-select",
                 allow_blank=False,
             ),
-            Static("Calculated:", classes="form-label"),
-            Static(f"  VAT Amount: €{vat_amount:,.2f}", id="calc-vat"),
-            Static(f"  Gross Total: €{gross:,.2f}", id="calc-gross"),
+            Static("Calculated:", id="calc-label", classes="form-label"),
+            Static(f"  VAT Amount: {vat_amount}", id="calc-vat"),
+            Static(f"  Gross Total: {gross}", id="calc-gross"),
         ]
 
     def _compose_step_2(self) -> ComposeResult:
@@ -298,13 +431,13 @@ class CreateWizard(ModalScreen[bool]):
     def _build_step_3(self) -> list:
         """Build step 3 widgets: Payment."""
         widgets = [
-            Label("Number of Installments", classes="form-label-first"),
+            Label("Number of Installments", id="installments-label", classes="form-label-first"),
             Input(
                 value=str(self.installments),
                 id="installments-input",
                 placeholder="1-12",
             ),
-            Label("First Installment Due Date", classes="form-label"),
+            Label("First Installment Due Date", id="first-due-label", classes="form-label"),
             Input(
                 value=self.first_due,
                 id="first-due-input",
@@ -313,32 +446,51 @@ class CreateWizard(ModalScreen[bool]):
         ]
 
         # Add preview widgets
-        widgets.extend(self._build_installment_preview())
+        self._installment_preview = self._build_installment_preview()
+        widgets.extend(self._installment_preview)
         return widgets
 
-    def _build_installment_preview(self) -> list:
-        """Build installment preview widgets."""
-        if self.installments <= 0 or self.amount_net <= 0:
+    def _build_installment_preview(
+        self,
+        installments: int | None = None,
+        first_due: str | None = None,
+    ) -> list:
+        """Build installment preview widgets.
+
+        Args:
+            installments: Override for installments (uses class value if None)
+            first_due: Override for first_due (uses class value if None)
+        """
+        effective_installments = installments if installments is not None else self.installments
+        effective_first_due = first_due if first_due is not None else self.first_due
+
+        if effective_installments <= 0 or self.amount_net <= 0:
             return []
 
         # Calculate installments
-        gross = self.amount_net * (1 + self.vat_rate / 100)
+        _, gross = self._amounts()
 
         try:
-            if self.first_due:
-                start_date = date.fromisoformat(self.first_due)
+            if effective_first_due:
+                start_date = _parse_iso(effective_first_due)
+                if start_date is None:
+                    return []
             else:
                 # Default: end of next month
-                from ...utils import end_of_month, add_months
                 next_month = add_months(date.today(), 1)
                 start_date = end_of_month(next_month.year, next_month.month)
 
-            dates = generate_installment_dates(start_date, self.installments)
-            amounts = split_amount(gross, self.installments)
+            dates = _installment_dates(start_date, effective_installments)
+            amounts = _installment_amounts(int(gross * 100), effective_installments)
 
-            widgets = [Static("Preview:", classes="form-label")]
+            widgets = [Static("Preview:", id="installment-preview-title", classes="form-label")]
             for i, (amount, due_date) in enumerate(zip(amounts, dates), 1):
-                widgets.append(Static(f"  Rata {i}: €{amount:,.2f} - due {due_date.strftime('%b %d, %Y')}"))
+                widgets.append(
+                    Static(
+                        f"  Rata {i}: {amount} - due {due_date}",
+                        id=f"installment-preview-{i}",
+                    )
+                )
             return widgets
         except Exception:
             return []
@@ -351,71 +503,65 @@ class CreateWizard(ModalScreen[bool]):
     def _build_step_4(self) -> list:
         """Build step 4 widgets: Recurrence."""
         widgets = [
-            Label("Enable Recurrence", classes="form-label-first"),
+            Label("Enable Recurrence", id="recurrence-enabled-label", classes="form-label-first"),
             Select(
-                [
-                    ("No - single expense", "no"),
-                    ("Yes - create recurring expenses", "yes"),
-                ],
+                _RECURRENCE_ENABLED_OPTIONS,
                 value="yes" if self.recurrence_enabled else "no",
                 id="recurrence-enabled-select",
                 allow_blank=False,
             ),
         ]
 
-        if self.recurrence_enabled:
-            # Determine select value: "custom" if custom mode, else the month number
-            select_value = "custom" if self.recurrence_is_custom else str(self.recurrence_every_months)
-
-            widgets.extend([
-                Label("Repeat Every", classes="form-label"),
-                Select(
-                    [
-                        ("1 month", "1"),
-                        ("2 months", "2"),
-                        ("3 months (quarterly)", "3"),
-                        ("4 months", "4"),
-                        ("6 months (semi-annual)", "6"),
-                        ("12 months (annual)", "12"),
-                        ("Custom...", "custom"),
-                    ],
-                    value=select_value,
-                    id="recurrence-every-select",
-                    allow_blank=False,
-                ),
-            ])
+        # Determine select value: "custom" if custom mode, else the month number
+        select_value = "custom" if self.recurrence_is_custom else str(self.recurrence_every_months)
 
-            # Add custom months input when "Custom..." is selected
-            if self.recurrence_is_custom:
-                widgets.extend([
-                    Label("Custom Months", classes="form-label"),
-                    Input(
-                        value=str(self.recurrence_every_months) if self.recurrence_every_months > 0 else "",
-                        id="recurrence-custom-input",
-                        placeholder="e.g., 4 (every 4 months)",
-                    ),
-                ])
-
-            widgets.extend([
-                Label("Total Occurrences", classes="form-label"),
-                Input(
-                    value=str(self.recurrence_count),
-                    id="recurrence-count-input",
-                    placeholder="e.g., 4 (creates 4 separate expenses)",
-                ),
-            ])
-
-            # Add recurrence preview
-            widgets.extend(self._build_recurrence_preview())
-        else:
-            widgets.append(
-                Static(
-                    "Recurrence creates multiple separate expenses at regular intervals.\n"
-                    "For example: quarterly rent, annual subscriptions.",
-                    classes="recurrence-disabled",
-                )
-            )
+        self._recurrence_preview = self._build_recurrence_preview()
 
+        # Custom months input, shown when "Custom..." is selected
+        custom_options = Vertical(
+            Label("Custom Months", id="recurrence-custom-label", classes="form-label"),
+            Input(
+                value=str(self.recurrence_every_months) if self.recurrence_every_months > 0 else "",
+                id="recurrence-custom-input",
+                placeholder="e.g., 4 (every 4 months)",
+            ),
+            id="recurrence-custom-options",
+            classes="recurrence-options",
+        )
+        custom_options.display = self.recurrence_is_custom
+
+        # Both the options and the help text are built; toggling just shows one or the other
+        options = Vertical(
+            Label("Repeat Every", id="recurrence-every-label", classes="form-label"),
+            Select(
+                _RECURRENCE_EVERY_OPTIONS,
+                value=select_value,
+                id="recurrence-every-select",
+                allow_blank=False,
+            ),
+            custom_options,
+            Label("Total Occurrences", id="recurrence-count-label", classes="form-label"),
+            Input(
+                value=str(self.recurrence_count),
+                id="recurrence-count-input",
+                placeholder="e.g., 4 (creates 4 separate expenses)",
+            ),
+            # Recurrence preview (empty while disabled)
+            *self._recurrence_preview,
+            id="recurrence-options",
+            classes="recurrence-options",
+        )
+        options.display = self.recurrence_enabled
+
+        help_text = Static(
+            "Recurrence creates multiple separate expenses at regular intervals.\n"
+            "For example: quarterly rent, annual subscriptions.",
+            id="recurrence-disabled-help",
+            classes="recurrence-disabled",
+        )
+        help_text.display = not self.recurrence_enabled
+
+        widgets.extend([options, help_text])
         return widgets
 
     def _build_recurrence_preview(
@@ -441,54 +587,135 @@ class CreateWizard(ModalScreen[bool]):
 
         # Validate months (need at least 1 month interval)
         if effective_every <= 0:
-            return [Static("⚠ Enter a valid number of months (1-120)", classes="recurrence-preview-error")]
-
-        try:
-            expense_date = date.fromisoformat(self.expense_date)
-        except (ValueError, TypeError):
-            expense_date = date.today()
+            return [
+                Static(
+                    "⚠ Enter a valid number of months (1-120)",
+                    id="recurrence-preview-error",
+                    classes="recurrence-preview-error",
+                )
+            ]
 
-        gross = self.amount_net * (1 + self.vat_rate / 100)
+        expense_date = _parse_iso(self.expense_date) or date.today()
 
-        widgets = [Static("Preview - expenses to be created:", classes="form-label")]
+        _, gross = self._amounts()
+        gross_str = f"€{gross:,.2f}"  # Same for every occurrence
 
-        # Generate dates for all occurrences
-        from dateutil.relativedelta import relativedelta
-        for i in range(min(effective_count, 12)):  # Show max 12 in preview
-            occurrence_date = expense_date + relativedelta(months=i * effective_every)
-            widgets.append(
-                Static(
-                    f"  {i + 1}. {occurrence_date.strftime('%b %d, %Y')} - €{gross:,.2f}",
-                    classes="recurrence-preview-item",
-                )
-            )
+        # Generate dates for all occurrences (show max 12 in preview)
+        occurrence_dates = _compute_recurrence_dates(expense_date, effective_every, min(effective_count, 12))
+        lines = [
+            f"  {i}. {format_date(occurrence_date)} - {gross_str}"
+            for i, occurrence_date in enumerate(occurrence_dates, 1)
+        ]
 
         if effective_count > 12:
-            widgets.append(Static(f"  ... and {effective_count - 12} more"))
+            lines.append(f"  ... and {effective_count - 12} more")
 
         total = gross * effective_count
-        widgets.append(Static(f"\n  Total: {effective_count} expenses = €{total:,.2f}"))
+        lines.append(f"\n  Total: {effective_count} expenses = €{total:,.2f}")
 
-        return widgets
+        # One Static for all the rows, so a refresh is a single text update
+        return [
+            Static("Preview - expenses to be created:", id="recurrence-preview-title", classes="form-label"),
+            Static(Text("\n".join(lines)), id="recurrence-preview", classes="recurrence-preview-item"),
+        ]
 
     def _compose_step_4(self) -> ComposeResult:
         """Compose step 4: Recurrence (for initial compose only)."""
         for widget in self._build_step_4():
             yield widget
 
-    def _rebuild_recurrence_step(self) -> None:
-        """Rebuild the recurrence step to show/hide options."""
-        self.run_worker(self._rebuild_recurrence_async(), exclusive=True, group="wizard-content")
+    def _schedule_preview(self, update: Callable[[], None]) -> None:
+        """Run a preview update once input pauses, replacing any pending one."""
+        self._cancel_preview()
+        self._preview_timer = self.set_timer(self.PREVIEW_DELAY, update)
+
+    def _cancel_preview(self) -> None:
+        """Drop a pending preview update (its widgets are about to change)."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer = None
+
+    def _show_recurrence_options(self) -> None:
+        """Show the recurrence options or help text, and the custom months input."""
+        self._widgets["recurrence-options"].display = self.recurrence_enabled
+        self._widgets["recurrence-disabled-help"].display = not self.recurrence_enabled
+        self._widgets["recurrence-custom-options"].display = self.recurrence_is_custom
+
+    @classmethod
+    def _with_nested(cls, widget: Widget) -> Iterator[Widget]:
+        """Yield a step widget and the ones nested in its option groups."""
+        yield widget
+        if isinstance(widget, Vertical):
+            for child in widget.children:
+                yield from cls._with_nested(child)
+
+    async def _reconcile(
+        self,
+        container: Widget,
+        widgets: list[Widget],
+        children: list[Widget] | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Make the children of container match the given widgets.
+
+        Leading children with the same id and type as the new widgets are kept:
+        Statics get the new text, Inputs and Selects keep what the user entered.
+        Verticals are always replaced, since their nested widgets were built for
+        the new state. The remaining children are removed and the remaining
+        widgets mounted.
 
-    async def _rebuild_recurrence_async(self) -> None:
-        """Rebuild recurrence step asynchronously."""
-        try:
-            content = self.query_one("#wizard-content", VerticalScroll)
-            await content.remove_children()
-            await content.mount_all(self._build_step_4())
-            self._focus_first_input()
-        except Exception as e:
-            self.app.notify(f"Rebuild error: {e}", severity="error")
+        Args:
+            container: Widget whose children are updated
+            widgets: The new children
+            children: Only reconcile these trailing children of container (e.g.
+                a preview); the list is updated in place to the new children
+            generation: Content generation the widgets were built for; nothing
+                is mounted if the step content was replaced in the meantime
+        """
+        if generation is not None and generation != self._content_generation:
+            return
+        tracked = children
+        children = list(container.children if tracked is None else tracked)
+
+        kept = 0
+        for old, new in zip(children, widgets):
+            if old.id is None or old.id != new.id or type(old) is not type(new):
+                break
+            if isinstance(old, Vertical):
+                break
+            if isinstance(old, Static) and old.content != new.content:
+                old.update(new.content)
+            for node in self._with_nested(old):
+                if node.id:
+                    self._widgets[node.id] = node
+            kept += 1
+
+        # Keep the id index of the step's widgets in sync
+        for widget in children[kept:]:
+            for node in self._with_nested(widget):
+                if node.id:
+                    self._widgets.pop(node.id, None)
+        for widget in widgets[kept:]:
+            if widget.id:
+                self._widgets[widget.id] = widget
+
+        # Tracked children are updated before each await, so a cancelled
+        # update leaves them matching what is actually in the container
+        if kept < len(children):
+            if tracked is not None:
+                del tracked[kept:]
+            await container.remove_children(children[kept:])
+            if generation is not None and generation != self._content_generation:
+                return  # A newer update owns the content now
+        if tracked is not None:
+            tracked[kept:] = widgets[kept:]
+        if kept < len(widgets):
+            await container.mount_all(widgets[kept:])
+            # Nested widgets are only reachable once mounted
+            for widget in widgets[kept:]:
+                for node in self._with_nested(widget):
+                    if node.id:
+                        self._widgets[node.id] = node
 
     def _update_recurrence_preview(self) -> None:
         """Update the recurrence preview based on current input values.
@@ -499,19 +726,19 @@ class CreateWizard(ModalScreen[bool]):
         """
         try:
             # Read current values from widgets (don't mutate class state)
-            enabled = self.query_one("#recurrence-enabled-select", Select).value == "yes"
+            enabled = self._widgets["recurrence-enabled-select"].value == "yes"
 
             if not enabled:
                 return
 
-            every_select = self.query_one("#recurrence-every-select", Select)
-            count_input = self.query_one("#recurrence-count-input", Input)
+            every_select = self._widgets["recurrence-every-select"]
+            count_input = self._widgets["recurrence-count-input"]
 
             # Handle custom vs preset selection
             if every_select.value == "custom":
                 # Read from custom input field
                 try:
-                    custom_input = self.query_one("#recurrence-custom-input", Input)
+                    custom_input = self._widgets["recurrence-custom-input"]
                     every_months = int(custom_input.value.strip())
                 except (ValueError, TypeError):
                     every_months = 0  # Invalid - preview will show error
@@ -525,22 +752,21 @@ class CreateWizard(ModalScreen[bool]):
             except (ValueError, TypeError):
                 count = 0
 
-            # Remove existing preview widgets
-            content = self.query_one("#wizard-content", VerticalScroll)
-            preview_widgets = []
-            found_count_input = False
-            for widget in list(content.children):
-                if found_count_input:
-                    preview_widgets.append(widget)
-                elif isinstance(widget, Input) and widget.id == "recurrence-count-input":
-                    found_count_input = True
-
-            for widget in preview_widgets:
-                widget.remove()
-
-            # Build and mount new preview (pass values as parameters, no state mutation)
-            for widget in self._build_recurrence_preview(every_months=every_months, count=count):
-                content.mount(widget)
+            # Replace the preview, updating rows in place
+            # (pass values as parameters, no state mutation)
+            options = self._widgets["recurrence-options"]
+            preview = self._build_recurrence_preview(every_months=every_months, count=count)
+            self.run_worker(
+                partial(
+                    self._reconcile,
+                    options,
+                    preview,
+                    children=self._recurrence_preview,
+                    generation=self._content_generation,
+                ),
+                exclusive=True,
+                group="wizard-preview",
+            )
 
         except Exception as e:
             self.app.notify(f"Preview update error: {e}", severity="error")
@@ -549,92 +775,75 @@ class CreateWizard(ModalScreen[bool]):
         """Update the installment preview based on current input values."""
         try:
             # Read current values from inputs
-            installments_str = self.query_one("#installments-input", Input).value.strip()
-            first_due = self.query_one("#first-due-input", Input).value.strip()
+            installments_str = self._widgets["installments-input"].value.strip()
+            first_due = self._widgets["first-due-input"].value.strip()
 
             try:
                 installments = int(installments_str)
             except (ValueError, TypeError):
                 installments = 0
 
-            # Remove existing preview widgets (those after the first-due-input)
-            content = self.query_one("#wizard-content", VerticalScroll)
-            preview_widgets = []
-            found_first_due = False
-            for widget in list(content.children):
-                if found_first_due:
-                    preview_widgets.append(widget)
-                elif isinstance(widget, Input) and widget.id == "first-due-input":
-                    found_first_due = True
-
-            for widget in preview_widgets:
-                widget.remove()
-
-            # Build new preview
-            if installments > 0 and self.amount_net > 0:
-                gross = self.amount_net * (1 + self.vat_rate / 100)
-
-                try:
-                    if first_due:
-                        start_date = date.fromisoformat(first_due)
-                    else:
-                        from ...utils import end_of_month, add_months
-                        next_month = add_months(date.today(), 1)
-                        start_date = end_of_month(next_month.year, next_month.month)
-
-                    dates = generate_installment_dates(start_date, installments)
-                    amounts = split_amount(gross, installments)
-
-                    # Mount new preview widgets
-                    content.mount(Static("Preview:", classes="form-label"))
-                    for i, (amount, due_date) in enumerate(zip(amounts, dates), 1):
-                        content.mount(Static(f"  Rata {i}: €{amount:,.2f} - due {due_date.strftime('%b %d, %Y')}"))
-                except ValueError:
-                    # Invalid date format - user is still typing, don't show error
-                    pass
-                except Exception as e:
-                    self.app.notify(f"Installment preview error: {e}", severity="warning")
+            # Replace the preview, updating rows in place
+            # (an invalid date while the user is typing just hides the preview)
+            content = self._content
+            preview = self._build_installment_preview(installments=installments, first_due=first_due)
+            self.run_worker(
+                partial(
+                    self._reconcile,
+                    content,
+                    preview,
+                    children=self._installment_preview,
+                    generation=self._content_generation,
+                ),
+                exclusive=True,
+                group="wizard-preview",
+            )
         except Exception as e:
             self.app.notify(f"Preview update error: {e}", severity="error")
 
     def _build_step_5(self) -> list:
         """Build step 5 widgets: Review."""
-        vat_amount = self.amount_net * self.vat_rate / 100
-        gross = self.amount_net + vat_amount
+        vat_amount, gross = self._amounts()
         first_due_str = self.first_due if self.first_due else "(end of next month)"
 
-        widgets = [
-            Static("Summary", classes="form-label-first"),
-            Static(""),
-            Static(f"  Supplier:      {self.supplier or '-'}"),
-            Static(f"  Description:   {self.description or '-'}"),
-            Static(f"  Date:          {self.expense_date}"),
-            Static(f"  Category:      {self.category or '-'}"),
-            Static(""),
-            Static(f"  Net:           €{self.amount_net:,.2f}"),
-            Static(f"  VAT ({self.vat_rate:.0f}%):      €{vat_amount:,.2f}"),
-            Static(f"  Gross:         €{gross:,.2f}"),
-            Static(""),
-            Static(f"  Installments:  {self.installments} (first due {first_due_str})"),
+        lines = [
+            "",
+            f"  Supplier:      {self.supplier or '-'}",
+            f"  Description:   {self.description or '-'}",
+            f"  Date:          {self.expense_date}",
+            f"  Category:      {self.category or '-'}",
+            "",
+            f"  Net:           €{self.amount_net:,.2f}",
+            f"  VAT ({self.vat_rate:.0f}%):      €{vat_amount:,.2f}",
+            f"  Gross:         €{gross:,.2f}",
+            "",
+            f"  Installments:  {self.installments} (first due {first_due_str})",
         ]
 
         # Add recurrence summary
         if self.recurrence_enabled:
-            widgets.append(Static(""))
-            widgets.append(Static("  ─── Recurrence ───"))
-            widgets.append(Static(f"  Repeat every:  {self.recurrence_every_months} month(s)"))
-            widgets.append(Static(f"  Occurrences:   {self.recurrence_count}"))
-
             # Show total expenses created and total cost
             total_cost = gross * self.recurrence_count
-            widgets.append(Static(""))
-            widgets.append(Static(f"  Total expenses to create: {self.recurrence_count}"))
-            widgets.append(Static(f"  Total cost: €{total_cost:,.2f}"))
+            lines.extend([
+                "",
+                "  ─── Recurrence ───",
+                f"  Repeat every:  {self.recurrence_every_months} month(s)",
+                f"  Occurrences:   {self.recurrence_count}",
+                "",
+                f"  Total expenses to create: {self.recurrence_count}",
+                f"  Total cost: €{total_cost:,.2f}",
+            ])
         else:
-            widgets.append(Static(""))
-            widgets.append(Static("  Recurrence:    Disabled (single expense)"))
+            lines.extend([
+                "",
+                "  Recurrence:    Disabled (single expense)",
+            ])
 
-        return widgets
+        # A single Static (plain Text, so user input isn't parsed as markup)
+        return [
+            Static("Summary", classes="form-label-first"),
+            Static(Text("\n".join(lines)), id="review-summary"),
+        ]
 
     def _compose_step_5(self) -> ComposeResult:
         """Compose step 5: Review (for initial compose only)."""
@@ -643,10 +852,10 @@ class CreateWizard(ModalScreen[bool]):
 
     def watch_current_step(self, step: int) -> None:
         """Update UI when step changes."""
+        self._cancel_preview()
         try:
             # Update tab styling
-            for i in range(1, self.TOTAL_STEPS + 1):
-                tab = self.query_one(f"#tab-{i}", Static)
+            for i, tab in enumerate(self._tabs, 1):
                 tab.remove_class("wizard-tab-active")
                 tab.remove_class("wizard-tab-completed")
                 if i < step:
@@ -656,11 +865,11 @@ class CreateWizard(ModalScreen[bool]):
         except Exception as e:
             self.app.notify(f"Tab error: {e}", severity="error")
 
-        # Update content asynchronously (use same group as _rebuild_recurrence_step to prevent race conditions)
+        # Update content asynchronously (exclusive, so a newer step change replaces a pending one)
         self.run_worker(self._update_step_content_async(step), exclusive=True, group="wizard-content")
 
         # Update button
-        next_btn = self.query_one("#next-btn", Button)
+        next_btn = self._next_btn
         if step == self.TOTAL_STEPS:
             next_btn.label = "✓ Create"
             next_btn.variant = "success"
@@ -669,7 +878,7 @@ class CreateWizard(ModalScreen[bool]):
             next_btn.variant = "primary"
 
         # Add back button for steps > 1
-        buttons = self.query_one("#wizard-buttons", Horizontal)
+        buttons = self._buttons
         try:
             back_btn = self.query_one("#back-btn", Button)
             if step == 1:
@@ -681,9 +890,14 @@ class CreateWizard(ModalScreen[bool]):
 
     async def _update_step_content_async(self, step: int) -> None:
         """Update the wizard content for the given step (async version)."""
+        # Newer updates (and previews built for older content) see the bump and stop
+        self._content_generation += 1
+        generation = self._content_generation
         try:
-            content = self.query_one("#wizard-content", VerticalScroll)
-            await content.remove_children()
+            content = self._content
+            self._widgets.clear()
+            self._installment_preview = []
+            self._recurrence_preview = []
 
             # Build widgets for the step
             widgets = []
@@ -698,8 +912,9 @@ class CreateWizard(ModalScreen[bool]):
             elif step == 5:
                 widgets = self._build_step_5()
 
-            await content.mount_all(widgets)
-            self._focus_first_input()
+            await self._reconcile(content, widgets, generation=generation)
+            if generation == self._content_generation:
+                self._focus_first_input()
         except Exception as e:
             self.app.notify(f"Content error: {e}", severity="error")
 
@@ -707,39 +922,41 @@ class CreateWizard(ModalScreen[bool]):
         """Save data from current step. Returns True if valid."""
         try:
             if self.current_step == 1:
-                self.supplier = self.query_one("#supplier-input", Input).value.strip()
-                self.description = self.query_one("#description-input", Input).value.strip()
-                self.category = self.query_one("#category-input", Input).value.strip()
-                self.expense_date = self.query_one("#date-input", Input).value.strip()
+                self.supplier = self._widgets["supplier-input"].value.strip()
+                self.description = self._widgets["description-input"].value.strip()
+                self.category = self._widgets["category-input"].value.strip()
+                self.expense_date = self._widgets["date-input"].value.strip()
 
                 if not self.supplier:
                     self._show_error("Supplier is required")
                     return False
 
                 # Validate date
-                try:
-                    date.fromisoformat(self.expense_date)
-                except ValueError:
+                self.expense_date_value = _parse_iso(self.expense_date)
+                if self.expense_date_value is None:
                     self._show_error("Invalid date format. Use YYYY-MM-DD.")
                     return False
 
             elif self.current_step == 2:
-                amount_str = self.query_one("#amount-input", Input).value.strip()
-                vat_select = self.query_one("#vat-select", Select)
+                amount_str = self._widgets["amount-input"].value.strip()
+                vat_select = self._widgets["vat-select"]
 
                 try:
-                    self.amount_net = float(amount_str)
-                    if self.amount_net <= 0:
+                    # Accept only what the VAT/gross shown and saved later can use
+                    _, gross = _vat_gross(amount_str, vat_select.value)
+                    amount_net = float(amount_str)
+                    if amount_net <= 0 or not math.isfinite(float(gross)):
                         raise ValueError()
                 except (ValueError, TypeError):
                     self._show_error("Net amount must be a positive number")
                     return False
+                self.amount_net = amount_net
 
                 self.vat_rate = float(vat_select.value)
 
             elif self.current_step == 3:
-                installments_str = self.query_one("#installments-input", Input).value.strip()
-                self.first_due = self.query_one("#first-due-input", Input).value.strip()
+                installments_str = self._widgets["installments-input"].value.strip()
+                self.first_due = self._widgets["first-due-input"].value.strip()
 
                 try:
                     self.installments = int(installments_str)
@@ -749,27 +966,25 @@ class CreateWizard(ModalScreen[bool]):
                     self._show_error("Installments must be between 1 and 120")
                     return False
 
-                if self.first_due:
-                    try:
-                        date.fromisoformat(self.first_due)
-                    except ValueError:
-                        self._show_error("Invalid first due date format. Use YYYY-MM-DD.")
-                        return False
+                self.first_due_value = _parse_iso(self.first_due) if self.first_due else None
+                if self.first_due and self.first_due_value is None:
+                    self._show_error("Invalid first due date format. Use YYYY-MM-DD.")
+                    return False
 
             elif self.current_step == 4:
-                enabled_select = self.query_one("#recurrence-enabled-select", Select)
+                enabled_select = self._widgets["recurrence-enabled-select"]
                 self.recurrence_enabled = enabled_select.value == "yes"
 
                 if self.recurrence_enabled:
-                    every_select = self.query_one("#recurrence-every-select", Select)
-                    count_input = self.query_one("#recurrence-count-input", Input)
+                    every_select = self._widgets["recurrence-every-select"]
+                    count_input = self._widgets["recurrence-count-input"]
 
                     # Handle custom vs preset selection
                     self.recurrence_is_custom = every_select.value == "custom"
                     if self.recurrence_is_custom:
                         # Read from custom input field
                         try:
-                            custom_input = self.query_one("#recurrence-custom-input", Input)
+                            custom_input = self._widgets["recurrence-custom-input"]
                             self.recurrence_every_months = int(custom_input.value.strip())
                             if self.recurrence_every_months < 1 or self.recurrence_every_months > 120:
                                 raise ValueError()
@@ -801,64 +1016,74 @@ class CreateWizard(ModalScreen[bool]):
         elif event.button.id == "cancel-btn":
             self.action_cancel()
 
+    def _unchanged(self, widget_id: str | None, value: object) -> bool:
+        """Check if a widget reports the value it had last time, and remember it.
+
+        Changed events also fire on mount and focus with the current value;
+        those don't need anything recomputed.
+        """
+        if widget_id is None:
+            return False
+        if widget_id in self._last_values and self._last_values[widget_id] == value:
+            return True
+        self._last_values[widget_id] = value
+        return False
+
+    def _update_calculated(self, amount: str, vat_rate: object) -> None:
+        """Show the VAT and gross amounts for the typed net amount (step 2)."""
+        try:
+            vat_amount, gross = _calc_vat_gross(amount, vat_rate)
+        except (ValueError, TypeError):
+            return  # Not a number (yet)
+        self._widgets["calc-vat"].update(f"  VAT Amount: {vat_amount}")
+        self._widgets["calc-gross"].update(f"  Gross Total: {gross}")
+
     def on_input_changed(self, event: Input.Changed) -> None:
         """Update calculated values when inputs change."""
-        if self.current_step == 2 and event.input.id == "amount-input":
-            try:
-                amount = float(event.value)
-                vat_rate = float(self.query_one("#vat-select", Select).value)
-                vat_amount = amount * vat_rate / 100
-                gross = amount + vat_amount
+        if self._unchanged(event.input.id, event.value):
+            return
 
-                self.query_one("#calc-vat", Static).update(f"  VAT Amount: €{vat_amount:,.2f}")
-                self.query_one("#calc-gross", Static).update(f"  Gross Total: €{gross:,.2f}")
-            except (ValueError, TypeError):
-                pass
+        if self.current_step == 2 and event.input.id == "amount-input":
+            self._update_calculated(event.value, self._widgets["vat-select"].value)
 
         # Update installment preview in step 3
         if self.current_step == 3 and event.input.id in ("installments-input", "first-due-input"):
-            self._update_installment_preview()
+            self._schedule_preview(self._update_installment_preview)
 
         # Update recurrence preview in step 4
         if self.current_step == 4 and event.input.id in ("recurrence-count-input", "recurrence-custom-input"):
-            self._update_recurrence_preview()
+            self._schedule_preview(self._update_recurrence_preview)
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Update calculated values when Select changes."""
-        if self.current_step == 2 and event.select.id == "vat-select":
-            try:
-                amount = float(self.query_one("#amount-input", Input).value)
-                vat_rate = float(event.value)
-                vat_amount = amount * vat_rate / 100
-                gross = amount + vat_amount
+        if self._unchanged(event.select.id, event.value):
+            return
 
-                self.query_one("#calc-vat", Static).update(f"  VAT Amount: €{vat_amount:,.2f}")
-                self.query_one("#calc-gross", Static).update(f"  Gross Total: €{gross:,.2f}")
-            except (ValueError, TypeError):
-                pass
+        if self.current_step == 2 and event.select.id == "vat-select":
+            self._update_calculated(self._widgets["amount-input"].value, event.value)
 
         # Handle recurrence toggle
         if self.current_step == 4 and event.select.id == "recurrence-enabled-select":
             new_enabled = event.value == "yes"
-            # IMPORTANT: Only rebuild if value actually changed to prevent infinite loop
+            # Only react if value actually changed
             # (Select.Changed can fire on mount/focus, not just user interaction)
             if new_enabled != self.recurrence_enabled:
                 self.recurrence_enabled = new_enabled
-                self.set_timer(0.05, self._rebuild_recurrence_step)
+                self._show_recurrence_options()
+                if new_enabled:
+                    self._update_recurrence_preview()
 
         # Handle recurrence frequency change
         if self.current_step == 4 and event.select.id == "recurrence-every-select":
             new_is_custom = event.value == "custom"
-            # If switching to/from custom mode, rebuild the step to show/hide custom input
+            # If switching to/from custom mode, show/hide the custom input
             if new_is_custom != self.recurrence_is_custom:
                 self.recurrence_is_custom = new_is_custom
                 if not new_is_custom:
                     # Switching from custom to preset: update the months value
                     self.recurrence_every_months = int(event.value)
-                self.set_timer(0.05, self._rebuild_recurrence_step)
-            else:
-                # Just a normal preset change, update preview
-                self._update_recurrence_preview()
+                self._show_recurrence_options()
+            self._schedule_preview(self._update_recurrence_preview)
 
     def _handle_next(self) -> None:
         """Handle next button."""
@@ -889,24 +1114,20 @@ class CreateWizard(ModalScreen[bool]):
     def _do_create_expense(self) -> None:
         """Actually create the expense(s) (runs in thread)."""
         try:
-            from dateutil.relativedelta import relativedelta
-
-            client = FICClient()
-
             # Calculate amounts
-            vat_amount = round(self.amount_net * self.vat_rate / 100, 2)
-            gross = self.amount_net + vat_amount
+            vat, gross_total = self._amounts()
+            vat_amount = float(vat)
+            gross = float(gross_total)
 
             # Determine first due date
-            if self.first_due:
-                first_due_date = date.fromisoformat(self.first_due)
+            if self.first_due_value is not None:
+                first_due_date = self.first_due_value
             else:
-                from ...utils import end_of_month, add_months
                 next_month = add_months(date.today(), 1)
                 first_due_date = end_of_month(next_month.year, next_month.month)
 
             # Base expense date
-            base_expense_date = date.fromisoformat(self.expense_date)
+            base_expense_date = self.expense_date_value
 
             # Determine how many expenses to create
             if self.recurrence_enabled:
@@ -914,41 +1135,70 @@ class CreateWizard(ModalScreen[bool]):
             else:
                 occurrences = 1
 
-            # Create expense(s)
-            for i in range(occurrences):
-                # Calculate date offset for this occurrence
-                month_offset = i * self.recurrence_every_months if self.recurrence_enabled else 0
-
-                # Expense date for this occurrence
-                occurrence_expense_date = base_expense_date + relativedelta(months=month_offset)
-
-                # Due date for this occurrence's first payment
-                occurrence_due_date = first_due_date + relativedelta(months=month_offset)
+            # Expense date and first payment due date of every occurrence
+            every_months = self.recurrence_every_months if self.recurrence_enabled else 0
+            month_offsets = [i * every_months for i in range(occurrences)]
+            occurrence_dates = [
+                (
+                    add_months(base_expense_date, months),
+                    add_months(first_due_date, months),
+                )
+                for months in month_offsets
+            ]
+
+            # Every occurrence shares the form values; bind them once
+            client = get_client()
+            create = partial(
+                client.create_expense,
+                supplier_name=self.supplier,
+                description=self.description or None,
+                category=self.category or None,
+                amount_net=self.amount_net,
+                amount_vat=vat_amount,
+            )
+            installments = self.installments
 
+            def create_one(expense_date: date, due_date: date) -> None:
                 # Create payment installments for this expense
                 payments = create_payment_installments(
                     total_amount=gross,
-                    num_installments=self.installments,
-                    start_date=occurrence_due_date,
+                    num_installments=installments,
+                    start_date=due_date,
                 )
 
                 # Create the expense
-                client.create_expense(
-                    supplier_name=self.supplier,
-                    description=self.description or None,
-                    category=self.category or None,
-                    amount_net=self.amount_net,
-                    amount_vat=vat_amount,
-                    expense_date=occurrence_expense_date,
-                    payments=payments,
-                )
-
-                # Update processing message to show progress
+                create(expense_date=expense_date, payments=payments)
+
+            # Create expense(s); occurrences are independent, so create them concurrently
+            errors: list[Exception] = []
+            futures = [
+                client.executor.submit(create_one, expense_date, due_date)
+                for expense_date, due_date in occurrence_dates
+            ]
+            last_update = 0.0
+            for done, future in enumerate(as_completed(futures), 1):
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+
+                # Update processing message to show progress (a burst of
+                # completions shows only the latest count)
                 if occurrences > 1:
-                    self.app.call_from_thread(
-                        self._update_processing,
-                        f"Creating expense {i + 1} of {occurrences}...",
+                    now = time.monotonic()
+                    if done == occurrences or now - last_update >= self.PROGRESS_INTERVAL:
+                        last_update = now
+                        self.app.call_from_thread(
+                            self._update_processing,
+                            f"Created {done} of {occurrences} expenses...",
+                        )
+
+            if errors:
+                created = occurrences - len(errors)
+                if created:
+                    raise RuntimeError(
+                        f"Created {created} of {occurrences} expenses; {len(errors)} failed: {errors[0]}"
                     )
+                raise errors[0]
 
             # Update quota display
             if client.last_quota:
@@ -967,31 +1217,26 @@ class CreateWizard(ModalScreen[bool]):
 
     def _update_processing(self, message: str) -> None:
         """Update the processing message."""
-        try:
-            processing = self.query_one("#processing", Static)
-            processing.update(message)
-        except Exception:
-            pass
+        self._processing.update(message)
 
     def _show_error(self, message: str) -> None:
         """Show error message."""
-        error = self.query_one("#error-message", Static)
-        error.update(f"Error: {message}")
-        error.add_class("visible")
+        self._error.update(f"Error: {message}")
+        self._error.add_class("visible")
 
     def _hide_error(self) -> None:
         """Hide error message."""
-        self.query_one("#error-message", Static).remove_class("visible")
+        self._error.remove_class("visible")
 
     def _show_processing(self) -> None:
         """Show processing indicator."""
-        self.query_one("#processing", Static).add_class("visible")
-        self.query_one("#next-btn", Button).disabled = True
+        self._processing.add_class("visible")
+        self._next_btn.disabled = True
 
     def _hide_processing(self) -> None:
         """Hide processing indicator."""
-        self.query_one("#processing", Static).remove_class("visible")
-        self.query_one("#next-btn", Button).disabled = False
+        self._processing.remove_class("visible")
+        self._next_btn.disabled = False
 
     def action_cancel(self) -> None:
         """Cancel and close wizard."""
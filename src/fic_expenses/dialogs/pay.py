@@ -1,6 +1,7 @@
 """Pay dialog for marking expenses as paid."""
 
-import os
+import math
+import time
 from datetime import date
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -11,7 +12,9 @@ from rich.text import Text
 
 from fattureincloud_python_sdk.models import ReceivedDocument
 
-from ..api import FICClient
+from ..api import get_client
+from ..config import get_settings
+from ..utils import parse_date
 
 
 class PayDialog(ModalScreen[bool]):
@@ -22,6 +25,9 @@ class PayDialog(ModalScreen[bool]):
         Binding("enter", "confirm", "Confirm", show=True),
     ]
 
+    # Minimum seconds between progress updates while paying several expenses
+    PROGRESS_INTERVAL = 0.1
+
     DEFAULT_CSS = """
     PayDialog {
         align: center middle;
@@ -115,16 +121,13 @@ class PayDialog(ModalScreen[bool]):
         self.expenses = expenses
         self.installment_index = installment_index
         self._default_account_id = self._get_default_account_id()
+        # Amount due for each expense, parallel to self.expenses
+        self._payable_amounts = [self._get_payable_amount(e) for e in expenses]
+        self._total = math.fsum(self._payable_amounts)
 
     def _get_default_account_id(self) -> int | None:
-        """Get default payment account ID from environment."""
-        account_id = os.getenv("FIC_DEFAULT_ACCOUNT_ID")
-        if account_id:
-            try:
-                return int(account_id)
-            except ValueError:
-                pass
-        return None
+        """Get default payment account ID from settings."""
+        return get_settings().default_account_id
 
     def compose(self) -> ComposeResult:
         """Create dialog layout."""
@@ -140,11 +143,8 @@ class PayDialog(ModalScreen[bool]):
 
             # Expense list
             with Vertical(classes="expense-list"):
-                total_amount = 0.0
-                for expense in self.expenses:
+                for expense, amount in zip(self.expenses, self._payable_amounts):
                     supplier = expense.entity.name if expense.entity else "Unknown"
-                    amount = self._get_payable_amount(expense)
-                    total_amount += amount
 
                     text = Text()
                     text.append(f"#{expense.id} ", style="dim")
@@ -153,7 +153,7 @@ class PayDialog(ModalScreen[bool]):
 
                     yield Static(text, classes="expense-item")
 
-                yield Static(f"Total: €{total_amount:,.2f}", classes="total-line")
+                yield Static(f"Total: €{self._total:,.2f}", classes="total-line")
 
             # Payment date input
             with Container(classes="form-group"):
@@ -186,6 +186,14 @@ class PayDialog(ModalScreen[bool]):
                 yield Button("Confirm", variant="primary", id="confirm-btn")
                 yield Button("Cancel", variant="default", id="cancel-btn")
 
+    def on_mount(self) -> None:
+        """Look up the widgets the dialog updates."""
+        self._date_input = self.query_one("#payment-date", Input)
+        self._error = self.query_one("#error-message", Static)
+        self._processing = self.query_one("#processing", Static)
+        self._confirm_btn = self.query_one("#confirm-btn", Button)
+        self._cancel_btn = self.query_one("#cancel-btn", Button)
+
     def _get_default_payment_date(self, expense: ReceivedDocument) -> str:
         """Get the default payment date for display in the input field.
 
@@ -240,12 +248,12 @@ class PayDialog(ModalScreen[bool]):
             return
 
         # Get and validate date (None means use each expense's date)
-        date_input = self.query_one("#payment-date", Input)
+        date_input = self._date_input
         payment_date: date | None = None
 
         if date_input.value.strip():
             try:
-                payment_date = date.fromisoformat(date_input.value)
+                payment_date = parse_date(date_input.value)
             except ValueError:
                 self._show_error("Invalid date format. Use YYYY-MM-DD.")
                 return
@@ -266,64 +274,100 @@ class PayDialog(ModalScreen[bool]):
         Args:
             payment_date: Date to use for all payments, or None to use each installment's due date.
         """
-        try:
-            client = FICClient()
-
-            for expense in self.expenses:
-                # Determine the payment date:
-                # 1. User-provided date takes precedence
-                # 2. For specific installment: use that installment's due_date
-                # 3. For "pay all": pass None so API uses each installment's due_date
-                if payment_date:
-                    expense_payment_date = payment_date
-                elif self.installment_index and expense.payments_list:
-                    # Specific installment - use its due_date
-                    idx = self.installment_index - 1
-                    if idx < len(expense.payments_list):
-                        expense_payment_date = expense.payments_list[idx].due_date
-                    else:
-                        expense_payment_date = None  # Let API handle fallback
+        # Determine the payment date for each expense:
+        # 1. User-provided date takes precedence
+        # 2. For specific installment: use that installment's due_date
+        # 3. For "pay all": pass None so API uses each installment's due_date
+        items = []
+        for expense in self.expenses:
+            if payment_date:
+                expense_payment_date = payment_date
+            elif self.installment_index and expense.payments_list:
+                # Specific installment - use its due_date
+                idx = self.installment_index - 1
+                if idx < len(expense.payments_list):
+                    expense_payment_date = expense.payments_list[idx].due_date
                 else:
-                    # Pay all - let API use each installment's due_date
-                    expense_payment_date = None
+                    expense_payment_date = None  # Let API handle fallback
+            else:
+                # Pay all - let API use each installment's due_date
+                expense_payment_date = None
+            items.append((expense.id, expense_payment_date))
+
+        done = 0
+        last_update = 0.0
+
+        def report_progress(document_id: int, error: Exception | None) -> None:
+            nonlocal done, last_update
+            done += 1
+            # A burst of completions shows only the latest count
+            now = time.monotonic()
+            if done == len(items) or now - last_update >= self.PROGRESS_INTERVAL:
+                last_update = now
+                self.app.call_from_thread(self._update_progress, done, len(items))
 
-                client.mark_expense_paid(
-                    document_id=expense.id,
-                    payment_account_id=self._default_account_id,
-                    paid_date=expense_payment_date,
-                    installment_index=self.installment_index,
-                )
+        try:
+            # Expenses are updated concurrently; one failure doesn't stop the others
+            client = get_client()
+            failures = client.mark_expenses_paid_bulk(
+                items,
+                payment_account_id=self._default_account_id,
+                installment_index=self.installment_index,
+                on_done=report_progress if len(items) > 1 else None,
+            )
 
             # Update quota display
             if client.last_quota:
                 self.app.update_quota(client.last_quota)
-
-            self.app.call_from_thread(self._payment_success)
         except Exception as e:
             self.app.call_from_thread(self._show_error, str(e))
             self.app.call_from_thread(self._hide_processing)
+            return
+
+        if not failures:
+            self.app.call_from_thread(self._payment_success)
+        elif len(failures) == len(items):
+            message = "; ".join(f"#{doc_id}: {error}" for doc_id, error in failures.items())
+            self.app.call_from_thread(self._show_error, message)
+            self.app.call_from_thread(self._hide_processing)
+        else:
+            self.app.call_from_thread(self._payment_partial_success, failures)
 
     def _payment_success(self) -> None:
         """Handle successful payment."""
         self.dismiss(True)
 
+    def _payment_partial_success(self, failures: dict[int, Exception]) -> None:
+        """Report expenses that could not be paid, then close to refresh the list."""
+        failed = ", ".join(f"#{doc_id}" for doc_id in sorted(failures))
+        first_error = next(iter(failures.values()))
+        self.app.notify(
+            f"Could not pay {len(failures)} of {len(self.expenses)} expenses ({failed}): {first_error}",
+            severity="error",
+        )
+        self.dismiss(True)
+
     def _show_error(self, message: str) -> None:
         """Show error message."""
-        error_widget = self.query_one("#error-message", Static)
-        error_widget.update(f"Error: {message}")
-        error_widget.add_class("visible")
+        self._error.update(f"Error: {message}")
+        self._error.add_class("visible")
 
     def _show_processing(self) -> None:
         """Show processing indicator."""
-        self.query_one("#processing", Static).add_class("visible")
-        self.query_one("#confirm-btn", Button).disabled = True
-        self.query_one("#cancel-btn", Button).disabled = True
+        self._processing.update("Processing payment...")
+        self._processing.add_class("visible")
+        self._confirm_btn.disabled = True
+        self._cancel_btn.disabled = True
+
+    def _update_progress(self, done: int, total: int) -> None:
+        """Show how many expenses have been processed."""
+        self._processing.update(f"Processing payments... {done}/{total}")
 
     def _hide_processing(self) -> None:
         """Hide processing indicator."""
-        self.query_one("#processing", Static).remove_class("visible")
-        self.query_one("#confirm-btn", Button).disabled = False
-        self.query_one("#cancel-btn", Button).disabled = False
+        self._processing.remove_class("visible")
+        self._confirm_btn.disabled = False
+        self._cancel_btn.disabled = False
 
     def action_cancel(self) -> None:
         """Cancel and close dialog."""
@@ -2,9 +2,12 @@
 
 from datetime import date
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .utils import add_months, end_of_month
 
 
 class RecurrencePeriod(str, Enum):
@@ -15,16 +18,23 @@ class RecurrencePeriod(str, Enum):
 
     def to_months(self) -> int:
         """Convert to number of months."""
-        return {
-            RecurrencePeriod.MONTHLY: 1,
-            RecurrencePeriod.BIANNUAL: 6,
-            RecurrencePeriod.YEARLY: 12,
-        }[self]
+        return _PERIOD_MONTHS[self]
+
+
+# Months in each recurrence period, built once instead of on every to_months()
+_PERIOD_MONTHS: dict[RecurrencePeriod, int] = {
+    RecurrencePeriod.MONTHLY: 1,
+    RecurrencePeriod.BIANNUAL: 6,
+    RecurrencePeriod.YEARLY: 12,
+}
 
 
 class ExpenseInput(BaseModel):
     """Input model for creating an expense."""
 
+    # Immutable, so the derived amounts below can be computed once
+    model_config = ConfigDict(frozen=True)
+
     supplier: str = Field(..., min_length=1, description="Supplier/vendor name")
     description: Optional[str] = Field(None, description="Expense description")
     category: Optional[str] = Field(None, description="Expense category")
@@ -36,12 +46,12 @@ class ExpenseInput(BaseModel):
     recurrence: Optional[RecurrencePeriod] = Field(None, description="Recurrence period")
     occurrences: int = Field(1, ge=1, le=10, description="Number of recurrence occurrences")
 
-    @property
+    @cached_property
     def amount_vat(self) -> float:
         """Calculate VAT amount."""
         return round(self.amount_net * self.vat_rate / 100, 2)
 
-    @property
+    @cached_property
     def amount_gross(self) -> float:
         """Calculate gross amount."""
         return round(self.amount_net + self.amount_vat, 2)
@@ -51,12 +61,6 @@ class ExpenseInput(BaseModel):
     def set_default_first_due(cls, v, info):
         """Set default first due date to end of next month."""
         if v is None:
-            from .utils import end_of_month
-            today = date.today()
-            month = today.month + 1
-            year = today.year
-            if month > 12:
-                month = 1
-                year += 1
-            return end_of_month(year, month)
+            next_month = add_months(date.today(), 1)
+            return end_of_month(next_month.year, next_month.month)
         return v
@@ -2,8 +2,6 @@
 
 from .loading import LoadingScreen
 from .error import ErrorScreen
-from .details import DetailsScreen
-from .settings import SettingsScreen
 
 __all__ = [
     "LoadingScreen",
@@ -11,3 +9,14 @@ __all__ = [
     "DetailsScreen",
     "SettingsScreen",
 ]
+
+
+def __getattr__(name: str):
+    """Import the screens opened on demand only when first used."""
+    if name == "DetailsScreen":
+        from .details import DetailsScreen
+        return DetailsScreen
+    if name == "SettingsScreen":
+        from .settings import SettingsScreen
+        return SettingsScreen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
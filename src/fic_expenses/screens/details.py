@@ -12,6 +12,8 @@ from rich.text import Text
 
 from fattureincloud_python_sdk.models import ReceivedDocument
 
+from ..api import get_client
+
 if TYPE_CHECKING:
     from ..app import FICExpensesApp
 
@@ -155,10 +157,8 @@ class DetailsScreen(Screen):
 
     def _fetch_expense(self) -> None:
         """Fetch expense details in background thread."""
-        from ..api import FICClient
-
         try:
-            client = FICClient()
+            client = get_client()
             expense = client.get_expense(self.expense_id)
             self.app.call_from_thread(self._display_expense, expense)
 
@@ -176,77 +176,43 @@ class DetailsScreen(Screen):
         loading = self.query_one("#loading-details", Static)
         loading.remove()
 
-        # Build detail view
-        container = VerticalScroll()
-        self.mount(container)
+        # Build the whole detail view first, then mount it in one go
+        sections = []
 
         # Header with supplier and description
-        header = Container(id="expense-header")
-        container.mount(header)
-
         supplier_name = expense.entity.name if expense.entity else "Unknown"
-        header.mount(Static(supplier_name, id="supplier-name"))
-
+        header = [Static(supplier_name, id="supplier-name")]
         if expense.description:
-            header.mount(Static(expense.description, id="expense-description"))
+            header.append(Static(expense.description, id="expense-description"))
+        sections.append(Container(*header, id="expense-header"))
 
         # Basic info section
-        info_section = Container(classes="detail-section")
-        container.mount(info_section)
-
-        info_section.mount(Static("Details", classes="section-title"))
-
-        # Date
-        date_row = Horizontal(classes="detail-row")
-        info_section.mount(date_row)
-        date_row.mount(Static("Date", classes="detail-label"))
         date_str = expense.var_date.strftime("%Y-%m-%d") if expense.var_date else "-"
-        date_row.mount(Static(date_str, classes="detail-value"))
-
-        # Category
+        info = [
+            Static("Details", classes="section-title"),
+            self._detail_row("Date", date_str),
+        ]
         if expense.category:
-            cat_row = Horizontal(classes="detail-row")
-            info_section.mount(cat_row)
-            cat_row.mount(Static("Category", classes="detail-label"))
-            cat_row.mount(Static(expense.category, classes="detail-value"))
+            info.append(self._detail_row("Category", expense.category))
+        sections.append(Container(*info, classes="detail-section"))
 
         # Amounts section
-        amounts_section = Container(classes="detail-section")
-        container.mount(amounts_section)
-
-        amounts_section.mount(Static("Amounts", classes="section-title"))
-
-        # Net
-        net_row = Horizontal(classes="detail-row")
-        amounts_section.mount(net_row)
-        net_row.mount(Static("Net", classes="detail-label"))
         net_str = f"€{expense.amount_net:,.2f}" if expense.amount_net else "-"
-        net_row.mount(Static(net_str, classes="detail-value"))
-
-        # VAT
-        vat_row = Horizontal(classes="detail-row")
-        amounts_section.mount(vat_row)
-        vat_row.mount(Static("VAT", classes="detail-label"))
         vat_str = f"€{expense.amount_vat:,.2f}" if expense.amount_vat else "-"
-        vat_row.mount(Static(vat_str, classes="detail-value"))
-
-        # Gross
-        gross_row = Horizontal(classes="detail-row")
-        amounts_section.mount(gross_row)
-        gross_row.mount(Static("Gross", classes="detail-label"))
         gross = (expense.amount_net or 0) + (expense.amount_vat or 0)
-        gross_row.mount(Static(f"€{gross:,.2f}", classes="detail-value"))
+        sections.append(
+            Container(
+                Static("Amounts", classes="section-title"),
+                self._detail_row("Net", net_str),
+                self._detail_row("VAT", vat_str),
+                self._detail_row("Gross", f"€{gross:,.2f}"),
+                classes="detail-section",
+            )
+        )
 
         # Payments section
         if expense.payments_list:
-            payments_section = Container(classes="detail-section")
-            container.mount(payments_section)
-
-            payments_section.mount(Static("Payment Schedule", classes="section-title"))
-
-            payments_container = Container(id="payments-container")
-            payments_section.mount(payments_container)
-
+            payment_rows = []
             for i, payment in enumerate(expense.payments_list, 1):
                 is_paid = payment.status == "paid"
                 icon = "✓" if is_paid else "○"
@@ -273,8 +239,25 @@ class DetailsScreen(Screen):
                     text.append(" │ ")
                     text.append(paid_str, style="dim")
 
-                payment_row = Static(text, classes=f"payment-row {style_class}")
-                payments_container.mount(payment_row)
+                payment_rows.append(Static(text, classes=f"payment-row {style_class}"))
+
+            sections.append(
+                Container(
+                    Static("Payment Schedule", classes="section-title"),
+                    Container(*payment_rows, id="payments-container"),
+                    classes="detail-section",
+                )
+            )
+
+        self.mount(VerticalScroll(*sections))
+
+    def _detail_row(self, label: str, value: str) -> Horizontal:
+        """Build a label/value row for a detail section."""
+        return Horizontal(
+            Static(label, classes="detail-label"),
+            Static(value, classes="detail-value"),
+            classes="detail-row",
+        )
 
     def _display_error(self, error_message: str) -> None:
         """Display error message."""
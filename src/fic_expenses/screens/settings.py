@@ -1,8 +1,17 @@
 """Settings screen for configuring FIC credentials."""
 
+import asyncio
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+import time
+from functools import cache, lru_cache
 from pathlib import Path
 
-from dotenv import dotenv_values, set_key
+from dotenv import dotenv_values
 from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -22,19 +31,31 @@ from textual.widgets.option_list import Option
 import fattureincloud_python_sdk
 from fattureincloud_python_sdk.api import InfoApi
 
+from ..api import FICClient, reset_client
+from ..config import reload_settings
 
+
+@cache
 def get_env_path() -> Path:
-    """Get the path to the .env file."""
-    cwd_env = Path.cwd() / ".env"
-    if cwd_env.exists():
-        return cwd_env
-    return cwd_env
+    """Get the path to the .env file (in the working directory at first call)."""
+    return Path.cwd() / ".env"
 
 
 def get_current_config() -> dict[str, str | None]:
     """Read current configuration from .env file."""
     env_path = get_env_path()
-    if env_path.exists():
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    # Keyed on the modification time, so edits to .env are picked up
+    return dict(_read_config(str(env_path), mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _read_config(env_path: str, mtime_ns: int | None) -> dict[str, str | None]:
+    """Parse the .env file (cached, see get_current_config)."""
+    if mtime_ns is not None:
         values = dotenv_values(env_path)
         return {
             "access_token": values.get("FIC_ACCESS_TOKEN"),
@@ -48,18 +69,156 @@ def get_current_config() -> dict[str, str | None]:
     }
 
 
-def validate_credentials(access_token: str, company_id: str) -> tuple[bool, str]:
-    """Validate credentials by making an API call."""
+# Key of a KEY=value line (optionally prefixed with "export")
+_ENV_KEY_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
+def write_env_values(env_path: Path, updates: dict[str, str]) -> None:
+    """Set several keys in a .env file with a single read and write.
+
+    Existing lines (comments, other keys) are kept; values are quoted like
+    dotenv's set_key(). The file is replaced atomically.
+    """
+    try:
+        lines = env_path.read_text().splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    found = set()
+    for i, line in enumerate(lines):
+        match = _ENV_KEY_RE.match(line)
+        if match and match.group(1) in updates:
+            key = match.group(1)
+            lines[i] = _format_env_line(key, updates[key])
+            found.add(key)
+    lines.extend(
+        _format_env_line(key, value) for key, value in updates.items() if key not in found
+    )
+
+    # mkstemp creates the file 0600; an existing .env keeps its own mode
+    fd, tmp_name = tempfile.mkstemp(dir=env_path.parent, prefix=env_path.name + ".")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(env_path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, env_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _format_env_line(key: str, value: str) -> str:
+    """Format a KEY='value' line as dotenv's set_key() does."""
+    escaped = value.replace("'", "\\'")
+    return f"{key}='{escaped}'"
+
+
+# Payment accounts rarely change; a cached list is shown while revalidating
+ACCOUNTS_CACHE_TTL = 24 * 60 * 60
+
+
+# Credentials validated this recently are not re-checked when the screen opens
+VALIDATION_TTL = 60 * 60
+
+
+def _cache_dir() -> Path:
+    """Get the fic-expenses cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "fic-expenses"
+
+
+def _accounts_cache_path(company_id: int) -> Path:
+    """Get the path of the payment accounts cache for a company."""
+    return _cache_dir() / f"accounts-{company_id}.json"
+
+
+def load_cached_accounts(company_id: int) -> list[tuple[int, str]] | None:
+    """Load cached payment accounts, or None if missing or expired."""
+    path = _accounts_cache_path(company_id)
+    try:
+        if time.time() - path.stat().st_mtime >= ACCOUNTS_CACHE_TTL:
+            return None
+        return [(acc["id"], acc["name"]) for acc in json.loads(path.read_text())]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached_accounts(company_id: int, accounts: list[tuple[int, str]]) -> None:
+    """Cache payment accounts on disk (best effort)."""
+    path = _accounts_cache_path(company_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([{"id": i, "name": n} for i, n in accounts]))
+    except OSError:
+        pass
+
+
+def _token_hash(access_token: str) -> str:
+    """Hash the token so it is never written to the cache in clear."""
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def load_recent_validation(
+    access_token: str, company_id: int
+) -> list[tuple[int, str]] | None:
+    """Get the accounts of a successful validation of these credentials
+    within VALIDATION_TTL, or None if they need to be validated again."""
+    path = _cache_dir() / "last_validation.json"
+    try:
+        data = json.loads(path.read_text())
+        if (
+            data["token_sha256"] != _token_hash(access_token)
+            or data["company_id"] != company_id
+            or time.time() - data["validated_at"] >= VALIDATION_TTL
+        ):
+            return None
+        return [(acc["id"], acc["name"]) for acc in data["accounts"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_validation(
+    access_token: str, company_id: int, accounts: list[tuple[int, str]]
+) -> None:
+    """Remember a successful validation (best effort)."""
+    path = _cache_dir() / "last_validation.json"
+    data = {
+        "token_sha256": _token_hash(access_token),
+        "company_id": company_id,
+        "validated_at": time.time(),
+        "accounts": [{"id": i, "name": n} for i, n in accounts],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+    except OSError:
+        pass
+
+
+def validate_and_fetch_accounts(
+    access_token: str, company_id: str
+) -> tuple[bool, str, list[tuple[int, str]]]:
+    """Validate credentials and fetch payment accounts with a single API call.
+
+    Returns:
+        (valid, message, accounts) where accounts are (id, name) pairs
+    """
     if not access_token or not access_token.strip():
-        return False, "Access token is required"
+        return False, "Access token is required", []
 
     if not company_id or not company_id.strip():
-        return False, "Company ID is required"
+        return False, "Company ID is required", []
 
     try:
         company_id_int = int(company_id.strip())
     except ValueError:
-        return False, "Company ID must be a number"
+        return False, "Company ID must be a number", []
 
     try:
         config = fattureincloud_python_sdk.Configuration()
@@ -68,35 +227,23 @@ def validate_credentials(access_token: str, company_id: str) -> tuple[bool, str]
         api_client = fattureincloud_python_sdk.ApiClient(config)
         api = InfoApi(api_client)
 
-        api.list_payment_accounts(company_id=company_id_int)
-        return True, "Credentials valid!"
+        response = api.list_payment_accounts(company_id=company_id_int)
 
     except Exception as e:
         error_msg = str(e)
         if "401" in error_msg or "Unauthorized" in error_msg:
-            return False, "Invalid access token"
+            return False, "Invalid access token", []
         elif "403" in error_msg or "Forbidden" in error_msg:
-            return False, "Access denied for this company"
+            return False, "Access denied for this company", []
         elif "404" in error_msg:
-            return False, "Company not found"
+            return False, "Company not found", []
         else:
-            return False, f"API error: {error_msg[:50]}"
-
-
-def fetch_payment_accounts(
-    access_token: str, company_id: int
-) -> list[tuple[int, str]]:
-    """Fetch payment accounts from the API."""
-    config = fattureincloud_python_sdk.Configuration()
-    config.access_token = access_token
+            return False, f"API error: {error_msg[:50]}", []
 
-    api_client = fattureincloud_python_sdk.ApiClient(config)
-    api = InfoApi(api_client)
-
-    response = api.list_payment_accounts(company_id=company_id)
-    accounts = response.data or []
-
-    return [(acc.id, acc.name) for acc in accounts]
+    accounts = [(acc.id, acc.name) for acc in response.data or []]
+    save_cached_accounts(company_id_int, accounts)
+    save_validation(access_token.strip(), company_id_int, accounts)
+    return True, "Credentials valid!", accounts
 
 
 class SettingsScreen(Screen):
@@ -192,6 +339,7 @@ class SettingsScreen(Screen):
         self.validated_token: str | None = None
         self.validated_company_id: int | None = None
         self.payment_accounts: list[tuple[int, str]] = []
+        self.payment_accounts_by_id: dict[int, str] = {}  # Index of payment_accounts
         self.selected_account_id: int | None = None
 
         if self.current_config["default_account_id"]:
@@ -255,7 +403,31 @@ class SettingsScreen(Screen):
 
     def on_mount(self) -> None:
         """Auto-validate existing credentials on mount."""
-        if self.current_config["access_token"] and self.current_config["company_id"]:
+        token = self.current_config["access_token"]
+        company = self.current_config["company_id"]
+        if token and company:
+            try:
+                company_id = int(company.strip())
+            except ValueError:
+                company_id = None
+
+            # Skip the API call if these credentials were validated recently
+            recent = load_recent_validation(token.strip(), company_id) if company_id else None
+            if recent is not None:
+                self.validated_token = token.strip()
+                self.validated_company_id = company_id
+                self.credentials_valid = True
+                self.payment_accounts = recent
+                self.payment_accounts_by_id = dict(recent)
+                self.show_validation_success("Credentials valid!")
+                return
+
+            # Show cached accounts right away; validation refreshes them
+            cached = load_cached_accounts(company_id) if company_id else None
+            if cached is not None:
+                self.payment_accounts = cached
+                self.payment_accounts_by_id = dict(cached)
+                self.show_accounts()
             self.run_validation()
 
     @on(Button.Pressed, "#validate-button")
@@ -263,31 +435,28 @@ class SettingsScreen(Screen):
         """Handle validate button press."""
         self.run_validation()
 
-    @work(thread=True)
-    def run_validation(self) -> None:
-        """Run credential validation in background thread."""
+    @work(exclusive=True, group="validate")
+    async def run_validation(self) -> None:
+        """Run credential validation (a new run cancels the one in flight)."""
         token = self.query_one("#token-input", Input).value
         company = self.query_one("#company-input", Input).value
 
-        self.app.call_from_thread(self.show_validation_pending)
-        valid, message = validate_credentials(token, company)
+        self.show_validation_pending()
+        valid, message, accounts = await asyncio.to_thread(
+            validate_and_fetch_accounts, token, company
+        )
 
         if valid:
             self.validated_token = token.strip()
             self.validated_company_id = int(company.strip())
             self.credentials_valid = True
+            self.payment_accounts = accounts
+            self.payment_accounts_by_id = dict(accounts)
 
-            try:
-                self.payment_accounts = fetch_payment_accounts(
-                    self.validated_token, self.validated_company_id
-                )
-            except Exception:
-                self.payment_accounts = []
-
-            self.app.call_from_thread(self.show_validation_success, message)
+            self.show_validation_success(message)
         else:
             self.credentials_valid = False
-            self.app.call_from_thread(self.show_validation_error, message)
+            self.show_validation_error(message)
 
     def show_validation_pending(self) -> None:
         """Show validation in progress."""
@@ -300,8 +469,10 @@ class SettingsScreen(Screen):
         status = self.query_one("#validation-status", Static)
         status.update(f"✓ {message}")
         status.set_classes("status-success")
+        self.show_accounts()
 
-        # Populate account list
+    def show_accounts(self) -> None:
+        """Populate the account list from payment_accounts."""
         account_list = self.query_one("#account-list", OptionList)
         account_list.clear_options()
 
@@ -312,10 +483,7 @@ class SettingsScreen(Screen):
 
         # Update current account display
         if self.selected_account_id:
-            current_name = next(
-                (name for aid, name in self.payment_accounts if aid == self.selected_account_id),
-                "Unknown",
-            )
+            current_name = self.payment_accounts_by_id.get(self.selected_account_id, "Unknown")
             self.query_one("#current-account", Static).update(
                 f"Current: {current_name} (ID: {self.selected_account_id})"
             )
@@ -345,10 +513,7 @@ class SettingsScreen(Screen):
         """Handle account selection."""
         if event.option.id:
             self.selected_account_id = int(event.option.id)
-            account_name = next(
-                (name for aid, name in self.payment_accounts if aid == self.selected_account_id),
-                "Unknown",
-            )
+            account_name = self.payment_accounts_by_id.get(self.selected_account_id, "Unknown")
             self.query_one("#current-account", Static).update(
                 f"Selected: {account_name} (ID: {self.selected_account_id})"
             )
@@ -362,14 +527,20 @@ class SettingsScreen(Screen):
 
         env_path = get_env_path()
 
-        if not env_path.exists():
-            env_path.touch()
-
-        set_key(str(env_path), "FIC_ACCESS_TOKEN", self.validated_token)
-        set_key(str(env_path), "FIC_COMPANY_ID", str(self.validated_company_id))
-
+        values = {
+            "FIC_ACCESS_TOKEN": self.validated_token,
+            "FIC_COMPANY_ID": str(self.validated_company_id),
+        }
         if self.selected_account_id:
-            set_key(str(env_path), "FIC_DEFAULT_ACCOUNT_ID", str(self.selected_account_id))
+            values["FIC_DEFAULT_ACCOUNT_ID"] = str(self.selected_account_id)
+
+        write_env_values(env_path, values)
+        # .env is only loaded once per process, apply to the running app too
+        os.environ.update(values)
+        _read_config.cache_clear()
+        reload_settings()
+        reset_client()
+        FICClient.invalidate_payment_accounts()
 
         self.notify("Configuration saved!", severity="information")
         self.action_go_back()
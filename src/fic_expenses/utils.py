@@ -2,18 +2,52 @@
 
 import calendar
 from datetime import date
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+
+
+# Days per month in a non-leap year (February handled in end_of_month)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Month abbreviations as strftime("%b") gives them in the C locale
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=256)
+def parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD date string.
+
+    Cached, since forms re-parse the same input on every keystroke.
+    Raises ValueError if the string is not a valid date.
+    """
+    return date.fromisoformat(value)
+
+
+def format_date(d: date) -> str:
+    """Format a date like strftime("%b %d, %Y"), e.g. "Feb 05, 2026"."""
+    return f"{_MONTH_ABBR[d.month - 1]} {d.day:02d}, {d.year}"
 
 
 def end_of_month(year: int, month: int) -> date:
     """Return the last day of the given month."""
-    last_day = calendar.monthrange(year, month)[1]
-    return date(year, month, last_day)
+    if month == 2 and calendar.isleap(year):
+        return date(year, 2, 29)
+    return date(year, month, _DAYS_IN_MONTH[month - 1])
 
 
 def add_months(d: date, months: int) -> date:
-    """Add N months to a date, preserving end-of-month behavior."""
-    return d + relativedelta(months=months)
+    """Add N months to a date, preserving end-of-month behavior.
+
+    Same result as `d + relativedelta(months=months)`: the day is clamped to
+    the length of the target month (Jan 31 + 1 month -> Feb 28/29).
+    """
+    year, month = divmod(d.month - 1 + months, 12)
+    year += d.year
+    month += 1
+    if month == 2 and calendar.isleap(year):
+        days = 29
+    else:
+        days = _DAYS_IN_MONTH[month - 1]
+    return date(year, month, min(d.day, days))
 
 
 def generate_installment_dates(
@@ -30,30 +64,24 @@ def generate_installment_dates(
         -> [2026-02-15, 2026-03-15, 2026-04-15]
 
     If the day doesn't exist in a month (e.g., Jan 31 -> Feb),
-    relativedelta adjusts to the last valid day (Feb 28/29).
+    add_months adjusts to the last valid day (Feb 28/29).
     """
-    dates = []
-    for i in range(num_installments):
-        dates.append(start_date + relativedelta(months=i))
-    return dates
+    return [add_months(start_date, i) for i in range(num_installments)]
 
 
 def split_amount(total: float, parts: int) -> list[float]:
     """
-    Split a total amount into N equal parts, handling rounding.
+    Split a total amount into N parts that differ by at most one cent.
+
+    Works in integer cents to avoid float drift: the leftover cents are
+    spread one each over the first parts, so the parts always sum to total.
 
-    Any remainder from rounding is added to the last part.
+    Example: split_amount(100.00, 3) -> [33.34, 33.33, 33.33]
     """
     if parts <= 0:
         return []
 
-    base = round(total / parts, 2)
-    amounts = [base] * parts
-
-    # Fix rounding error by adjusting last installment
-    actual_sum = sum(amounts)
-    diff = round(total - actual_sum, 2)
-    if diff != 0:
-        amounts[-1] = round(amounts[-1] + diff, 2)
+    cents = round(total * 100)
+    base, extra = divmod(cents, parts)
 
-    return amounts
+    return [(base + 1) / 100 if i < extra else base / 100 for i in range(parts)]
@@ -11,6 +11,13 @@ from rich.text import Text
 
 from fattureincloud_python_sdk.models import ReceivedDocument
 
+from ..utils import format_date
+
+
+# Status cells are the same for every row, so build them once
+_UNPAID_STATUS = Text("Unpaid", style="bold yellow")
+_PAID_STATUS = Text("Paid ✓", style="bold green")
+
 
 class ExpensesTable(DataTable):
     """DataTable for displaying expenses with multi-selection support."""
@@ -87,14 +94,18 @@ class ExpensesTable(DataTable):
         self._row_to_expense.clear()
         self.selected_ids = set()
 
-        for idx, expense in enumerate(expenses):
+        self.append_expenses(expenses)
+
+        self._post_selection_changed()
+
+    def append_expenses(self, expenses: list[ReceivedDocument]) -> None:
+        """Append expenses after the existing rows, keeping the selection."""
+        for idx, expense in enumerate(expenses, start=self.row_count):
             row_key = self._add_expense_row(expense)
             self._expenses[row_key] = expense
             if expense.id:
                 self._row_to_expense[idx] = expense.id
 
-        self._post_selection_changed()
-
     def _add_expense_row(self, expense: ReceivedDocument) -> str:
         """Add a single expense row to the table."""
         expense_id = expense.id or 0
@@ -106,7 +117,7 @@ class ExpensesTable(DataTable):
         # Format expense date (verbose: "Jan 15, 2024")
         date_str = "-"
         if expense.var_date:
-            date_str = expense.var_date.strftime("%b %d, %Y")
+            date_str = format_date(expense.var_date)
 
         # Format amounts
         net_amount = expense.amount_net or 0
@@ -127,7 +138,7 @@ class ExpensesTable(DataTable):
         # Format due date (verbose: "Jan 15, 2024")
         due_str = "-"
         if next_due:
-            due_str = next_due.strftime("%b %d, %Y")
+            due_str = format_date(next_due)
 
         row_key = self.add_row(
             checkbox,
@@ -149,12 +160,10 @@ class ExpensesTable(DataTable):
         # Use next_due_date from list API (payments_list is None in list response)
         if expense.next_due_date is not None:
             # Has unpaid payments
-            status = Text("Unpaid", style="bold yellow")
-            return status, expense.next_due_date
+            return _UNPAID_STATUS, expense.next_due_date
         else:
             # Fully paid or no payments configured
-            status = Text("Paid ✓", style="bold green")
-            return status, None
+            return _PAID_STATUS, None
 
     def action_toggle_select(self) -> None:
         """Toggle selection of current row."""
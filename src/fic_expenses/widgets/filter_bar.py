@@ -1,6 +1,8 @@
 """Filter bar widget for filtering expenses."""
 
 from datetime import date
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.message import Message
@@ -9,6 +11,36 @@ from textual.widget import Widget
 from textual import on
 
 
+@lru_cache(maxsize=32)
+def _build_query(supplier: str, from_date: str, to_date: str) -> str | None:
+    """Build the FIC API query for the given filter values (memoized).
+
+    Returns None if no filters are set.
+    Uses FIC query syntax: field = 'value' AND field LIKE '%value%'
+    """
+    conditions = []
+
+    # Supplier filter (LIKE query)
+    if supplier:
+        # Escape single quotes in supplier name
+        supplier = supplier.replace("'", "''")
+        conditions.append(f"entity.name LIKE '%{supplier}%'")
+
+    # Date range filters
+    if from_date:
+        conditions.append(f"date >= '{from_date}'")
+
+    if to_date:
+        conditions.append(f"date <= '{to_date}'")
+
+    # Note: Status (paid/unpaid) is added separately via build_status_query(),
+    # so the app can drop it if the API rejects the next_due_date condition
+
+    if conditions:
+        return " AND ".join(conditions)
+    return None
+
+
 class FilterBar(Widget):
     """Filter controls for the expenses list."""
 
@@ -58,6 +90,12 @@ class FilterBar(Widget):
 
     DEFAULT_LIMIT = 50
 
+    # FIC API conditions for the status filter (see next_due_date in CLAUDE.md)
+    STATUS_QUERIES = {
+        "paid": "next_due_date IS NULL",
+        "unpaid": "next_due_date IS NOT NULL",
+    }
+
     class ApplyFilters(Message):
         """Posted when Apply button is pressed."""
 
@@ -198,24 +236,11 @@ class FilterBar(Widget):
         Uses FIC query syntax: field = 'value' AND field LIKE '%value%'
         """
         filters = self.get_filters()
-        conditions = []
+        return _build_query(filters["supplier"], filters["from_date"], filters["to_date"])
 
-        # Supplier filter (LIKE query)
-        if filters["supplier"]:
-            # Escape single quotes in supplier name
-            supplier = filters["supplier"].replace("'", "''")
-            conditions.append(f"entity.name LIKE '%{supplier}%'")
+    def build_status_query(self) -> str | None:
+        """Build the FIC API condition for the current status filter.
 
-        # Date range filters
-        if filters["from_date"]:
-            conditions.append(f"date >= '{filters['from_date']}'")
-
-        if filters["to_date"]:
-            conditions.append(f"date <= '{filters['to_date']}'")
-
-        # Note: Status (paid/unpaid) cannot be filtered via API query,
-        # it will be handled client-side based on next_due_date
-
-        if conditions:
-            return " AND ".join(conditions)
-        return None
+        Returns None when no status is selected.
+        """
+        return self.STATUS_QUERIES.get(self.get_filters()["status"])
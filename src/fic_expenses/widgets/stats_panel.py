@@ -2,6 +2,8 @@
 
 from collections import defaultdict
 from datetime import date
+from itertools import compress
+from operator import attrgetter
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Static
@@ -77,22 +79,32 @@ class StatsPanel(Widget):
             yield Static("📊 BY SUPPLIER", classes="stats-header")
             yield Static("", id="supplier-count", classes="stats-value")
 
-    def update_stats(self, expenses: list[ReceivedDocument]) -> None:
-        """Update all statistics from the expense list."""
-        self._update_overdue(expenses)
-        self._update_time_periods(expenses)
-        self._update_supplier_insights(expenses)
-
-    def _update_overdue(self, expenses: list[ReceivedDocument]) -> None:
+    def update_stats(
+        self, expenses: list[ReceivedDocument], gross: list[float] | None = None
+    ) -> None:
+        """Update all statistics from the expense list.
+
+        Args:
+            expenses: Expenses to summarize
+            gross: Gross amount of each expense, if already computed
+        """
+        if gross is None:
+            gross = [(e.amount_net or 0) + (e.amount_vat or 0) for e in expenses]
+        # Read the model attributes once into parallel columns; each section
+        # then works on plain lists
+        due_dates = list(map(attrgetter("next_due_date"), expenses))
+        var_dates = list(map(attrgetter("var_date"), expenses))
+        suppliers = [e.entity.name if e.entity else "Unknown" for e in expenses]
+        self._update_overdue(due_dates, gross)
+        self._update_time_periods(var_dates, gross)
+        self._update_supplier_insights(suppliers, gross)
+
+    def _update_overdue(self, due_dates: list[date | None], gross: list[float]) -> None:
         """Update overdue statistics."""
         today = date.today()
-        overdue_count = 0
-        overdue_total = 0.0
-
-        for expense in expenses:
-            if expense.next_due_date is not None and expense.next_due_date < today:
-                overdue_count += 1
-                overdue_total += (expense.amount_net or 0) + (expense.amount_vat or 0)
+        overdue = [due is not None and due < today for due in due_dates]
+        overdue_count = sum(overdue)
+        overdue_total = sum(compress(gross, overdue), 0.0)
 
         widget = self.query_one("#overdue-stats", Static)
         text = f"{overdue_count} expenses (€{overdue_total:,.2f})"
@@ -106,7 +118,9 @@ class StatsPanel(Widget):
             widget.remove_class("stats-value-highlight")
             widget.add_class("stats-value")
 
-    def _update_time_periods(self, expenses: list[ReceivedDocument]) -> None:
+    def _update_time_periods(
+        self, var_dates: list[date | None], gross: list[float]
+    ) -> None:
         """Update time-based aggregate statistics."""
         today = date.today()
         this_month_start = today.replace(day=1)
@@ -126,27 +140,24 @@ class StatsPanel(Widget):
         ytd_total = 0.0
         monthly_totals: dict[tuple[int, int], float] = defaultdict(float)
 
-        for expense in expenses:
-            if not expense.var_date:
+        for exp_date, amount in zip(var_dates, gross):
+            if not exp_date:
                 continue
 
-            gross = (expense.amount_net or 0) + (expense.amount_vat or 0)
-            exp_date = expense.var_date
-
             # This month
             if exp_date >= this_month_start:
-                this_month_total += gross
+                this_month_total += amount
 
             # Last month
             if last_month_start <= exp_date < last_month_end:
-                last_month_total += gross
+                last_month_total += amount
 
             # Year to date
             if exp_date >= year_start:
-                ytd_total += gross
+                ytd_total += amount
 
             # Monthly totals for average calculation
-            monthly_totals[(exp_date.year, exp_date.month)] += gross
+            monthly_totals[(exp_date.year, exp_date.month)] += amount
 
         # Calculate monthly average (exclude current month if incomplete)
         completed_months = [
@@ -173,16 +184,14 @@ class StatsPanel(Widget):
             f"Monthly avg: €{monthly_avg:,.2f}"
         )
 
-    def _update_supplier_insights(self, expenses: list[ReceivedDocument]) -> None:
+    def _update_supplier_insights(
+        self, suppliers: list[str], gross: list[float]
+    ) -> None:
         """Update supplier statistics."""
         supplier_totals: dict[str, float] = defaultdict(float)
-        supplier_counts: dict[str, int] = defaultdict(int)
 
-        for expense in expenses:
-            supplier = expense.entity.name if expense.entity else "Unknown"
-            gross = (expense.amount_net or 0) + (expense.amount_vat or 0)
-            supplier_totals[supplier] += gross
-            supplier_counts[supplier] += 1
+        for supplier, amount in zip(suppliers, gross):
+            supplier_totals[supplier] += amount
 
         # Top 3 suppliers by total amount
         sorted_suppliers = sorted(
@@ -202,7 +211,7 @@ class StatsPanel(Widget):
             self.query_one(f"#top-supplier-{i}", Static).update("")
 
         # Supplier count summary
-        unique_suppliers = len(supplier_counts)
+        unique_suppliers = len(supplier_totals)
         self.query_one("#supplier-count", Static).update(
             f"{unique_suppliers} unique suppliers"
         )